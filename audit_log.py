@@ -0,0 +1,94 @@
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import datetime
+
+from config.settings import AUDIT_LOG_DIR, AUDIT_SEGMENT_BYTES
+from utils.segmented_log import SegmentedLog
+
+class AuditLog:
+    """
+    Append-only audit records for every entity.
+
+    Each audit is one JSON line in numbered segment files, rolled at
+    `segment_bytes`, instead of a file per audit. Records arrive in time
+    order, so the in-memory indexes rebuilt on open stay sorted: record id →
+    (segment, offset) and timestamp, entity → its record ids and times.
+    History and time-range queries are bisects plus one seek per record.
+    """
+
+    def __init__(self, directory=AUDIT_LOG_DIR, segment_bytes=AUDIT_SEGMENT_BYTES):
+        self.log = SegmentedLog(directory, "audits", segment_bytes)
+        self.dir = self.log.dir
+        self.locations = []                    # record id → (segment, offset)
+        self.times = []                        # record id → ISO timestamp
+        self.by_entity = defaultdict(list)     # entity → [record id]
+        self.entity_times = defaultdict(list)  # entity → [timestamp], parallel to by_entity
+        for record, segment, offset in self.log.scan():
+            self._index(record, segment, offset)
+
+    def _index(self, record, segment, offset):
+        record_id = len(self.locations)
+        self.locations.append((segment, offset))
+        self.times.append(record["ts"])
+        self.by_entity[record["entity"]].append(record_id)
+        self.entity_times[record["entity"]].append(record["ts"])
+        return record_id
+
+    def _read(self, record_id):
+        return self.log.read(*self.locations[record_id])
+
+    # --- writes ---
+
+    def record(self, entity, model, prompt: str, response: str, timestamp=None) -> int:
+        ts = timestamp or datetime.now().isoformat()
+        if self.times and ts < self.times[-1]:
+            ts = self.times[-1]  # keep the time index sorted under clock skew
+        record = {"entity": entity, "ts": ts, "model": model, "prompt": prompt, "response": response}
+        return self._index(record, *self.log.append(record))
+
+    def flush(self):
+        self.log.flush()
+
+    def close(self):
+        self.log.close()
+
+    # --- reads ---
+
+    def count(self, entity=None) -> int:
+        return len(self.locations) if entity is None else len(self.by_entity.get(entity, []))
+
+    def history(self, entity, since=None, until=None, limit=None) -> list:
+        """`entity`'s audits with since <= ts < until (ISO strings), oldest first; `limit` keeps the newest."""
+        ids = self.by_entity.get(entity, [])
+        times = self.entity_times.get(entity, [])
+        lo = bisect_left(times, since) if since else 0
+        hi = bisect_left(times, until) if until else len(ids)
+        if limit is not None:
+            lo = max(lo, hi - limit)
+        return [self._read(r) for r in ids[lo:hi]]
+
+    def latest(self, entity):
+        ids = self.by_entity.get(entity)
+        return self._read(ids[-1]) if ids else None
+
+    def between(self, since=None, until=None, limit=None) -> list:
+        """Every audit with since <= ts < until, oldest first."""
+        lo = bisect_left(self.times, since) if since else 0
+        hi = bisect_left(self.times, until) if until else len(self.times)
+        if limit is not None:
+            hi = min(hi, lo + limit)
+        return [self._read(r) for r in range(lo, hi)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+_default_log = None
+
+def audit_log() -> AuditLog:
+    global _default_log
+    if _default_log is None:
+        _default_log = AuditLog()
+    return _default_log
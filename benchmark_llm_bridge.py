@@ -0,0 +1,113 @@
+import argparse
+import contextlib
+import io
+import json
+import threading
+import time
+
+from config.settings import LLM_DEADLINE
+from entity_auditor import EntityAuditor
+from gpt_bridge_optimized import GPTCommunicator, close_sessions
+from llm_standin import StandInServer
+
+OUTPUT_FILE = "benchmark_llm_bridge.json"
+CONCURRENCY_LEVELS = [1, 4, 8, 16, 32]
+
+class TimedCommunicator(GPTCommunicator):
+    """
+    GPTCommunicator that records the wall time of every complete() call,
+    retries included. Built without the rate limiter so the numbers measure
+    the bridge, not the budget.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latencies = []
+        self._lock = threading.Lock()
+
+    def complete(self, prompt, system=None, deadline=LLM_DEADLINE):
+        start = time.perf_counter()
+        try:
+            return super().complete(prompt, system, deadline)
+        finally:
+            with self._lock:
+                self.latencies.append(time.perf_counter() - start)
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+def synthetic_entities(n):
+    return {
+        f"Bench_{i:05d}": {
+            "archetype": ["Seeker", "Warden", "Oracle", "Weaver"][i % 4],
+            "tokens": ["echo", "veil", "anchor", "glyph"][: 2 + i % 3],
+            "memory": [f"memory {i}-{j}" for j in range(4)],
+            "sd": i % 7,
+            "ess": round(0.3 + (i % 10) / 20, 2),
+            "drift": round((i % 9) / 10, 2),
+        }
+        for i in range(n)
+    }
+
+def bench_audit(endpoint, entities, concurrency):
+    auditor = EntityAuditor(model="gpt")
+    auditor.gpt = TimedCommunicator(endpoint=endpoint, cache=False, limiter=False)
+    batch = {name: dict(data) for name, data in entities.items()}
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        responses = auditor.audit_many(batch, store=False, max_concurrency=concurrency)
+    wall = time.perf_counter() - start
+
+    latencies = sorted(auditor.gpt.latencies)
+    failed = sum(1 for r in responses.values() if r.startswith(f"[{auditor.gpt.error_label}]"))
+    return {
+        "concurrency": concurrency,
+        "audits": len(responses),
+        "failed": failed,
+        "wall_sec": round(wall, 3),
+        "audits_per_sec": round(len(responses) / wall, 2),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "max_ms": round(latencies[-1] * 1000, 1) if latencies else 0.0,
+    }
+
+def run_benchmark(entities=200, levels=CONCURRENCY_LEVELS, latency="lognormal:0.2,0.5", error_rate=0.02, seed=7):
+    population = synthetic_entities(entities)
+    results = []
+    with StandInServer(latency=latency, error_rate=error_rate, seed=seed) as server:
+        print(f"🛰 Stand-in at {server.endpoint} — latency {latency}, error rate {error_rate:.0%}")
+        for level in levels:
+            print(f"\n⚙️ Auditing {entities} entities at concurrency {level}...")
+            results.append(bench_audit(server.endpoint, population, level))
+            close_sessions()
+        server_stats = dict(server.stats)
+
+    print("\n📊 Bridge Throughput & Tail Latency")
+    print("═══════════════════════════════════════════════════════════════════")
+    print(f"{'conc':>5} {'audits/s':>9} {'wall s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'failed':>7}")
+    for r in results:
+        print(f"{r['concurrency']:>5} {r['audits_per_sec']:>9} {r['wall_sec']:>8} {r['p50_ms']:>8} "
+              f"{r['p95_ms']:>8} {r['p99_ms']:>8} {r['max_ms']:>8} {r['failed']:>7}")
+    print("═══════════════════════════════════════════════════════════════════")
+    print(f"🛰 Stand-in served {server_stats['requests']} requests, injected {server_stats['errors']} errors")
+
+    with open(OUTPUT_FILE, "w") as f:
+        json.dump({"latency": latency, "error_rate": error_rate, "entities": entities,
+                   "server": server_stats, "results": results}, f, indent=2)
+    print(f"\n📁 Saved benchmark results to {OUTPUT_FILE}")
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batch audits against the local LLM stand-in")
+    parser.add_argument("--entities", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=CONCURRENCY_LEVELS)
+    parser.add_argument("--latency", default="lognormal:0.2,0.5")
+    parser.add_argument("--error-rate", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    run_benchmark(args.entities, args.concurrency, args.latency, args.error_rate, args.seed)
@@ -1,8 +1,8 @@
 # civilization/village_engine.py
 
-import random
 import uuid
 from datetime import datetime
+from utils.rng_streams import stream
 
 # Define available building types
 BUILDING_TYPES = {
@@ -86,14 +86,15 @@ class Village:
     def tick(self):
         """Simulate one passage of time in the village."""
         # Simulate drift and morale fluctuation
+        rng = stream("village")
         old_drift = self.drift
-        self.drift = max(0.0, self.drift + random.uniform(-0.01, 0.03))
-        if self.drift > 0.5 and random.random() < 0.2:
+        self.drift = max(0.0, self.drift + rng.uniform(-0.01, 0.03))
+        if self.drift > 0.5 and rng.random() < 0.2:
             self.log("⚠️ Village drift is high — strange tensions emerge.")
 
         # Random building damage (simulated wear)
         for b in self.buildings.values():
-            b.health = max(0, b.health - random.randint(0, 2))
+            b.health = max(0, b.health - rng.randint(0, 2))
         self.log(f"🔁 Drift tick: {round(old_drift, 3)} → {round(self.drift, 3)}")
 
     def summary(self):
@@ -43,8 +43,15 @@ SIM_CYCLES = 10
 SIM_DELAY = 0.5
 AUTO_SAVE_INTERVAL = 3
 ECHO_LOGGING_ENABLED = True
-CYCLE_OVERDRIVE_MODE = False
+CYCLE_OVERDRIVE_MODE = False     # Level-of-detail: idle entities advance in coarse batched steps
+LOD_COARSE_INTERVAL = 8          # Ticks between coarse steps for dormant/quarantined/off-screen entities
 MAX_ENTITY_INTERACTIONS_PER_CYCLE = 15
+SHARD_COUNT = 0                  # Worker processes for sharded runs (0 → one per CPU core)
+CHECKPOINT_DIR = "checkpoints"
+CHECKPOINT_REBASE_INTERVAL = 50  # Deltas appended before a fresh base snapshot is written
+METRICS_DIR = "metrics"
+EVENT_LOG_PATH = "logs/events.jsonl"
+METRICS_CHUNK_TICKS = 4096       # Ticks buffered in memory before a metrics chunk is flushed
 
 # === ENTITY EVOLUTION & RANKING ===
 XP_LEVEL_THRESHOLDS = [50, 100, 200, 400, 800]
@@ -103,6 +110,26 @@ DIALOGUE_DISTORTIONS = {
     "pain": "ink"
 }
 
+# === DIALOGUE RESPONSE CACHE ===
+RESPONSE_CACHE_MAX_ENTRIES = 4096
+RESPONSE_CACHE_MAX_BYTES = 8 * 1024 * 1024
+RESPONSE_CACHE_SEEDED = False    # Cache RNG-driven replies too, drawing them from a per-key seed
+
+# === DIALOGUE HISTORY STORE ===
+DIALOGUE_STORE_ENABLED = False   # Persist every query_entity turn to the indexed dialogue store
+DIALOGUE_STORE_DIR = "dialogue_store"
+DIALOGUE_SEGMENT_BYTES = 64 * 1024 * 1024
+DIALOGUE_LOG_INLINE = 50         # With the store on, metadata["dialogue_log"] keeps only this many entries
+LORE_EXPORT_DIR = "exports"
+LORE_CACHE_DIR = "exports/lore_cache"
+
+# === DASHBOARD PROMPT BROADCAST ===
+PROMPT_STREAM_CHUNK = 256        # Replies synthesized per batch on the streaming ALL-entities endpoint
+PROMPT_STREAM_SAVE_EVERY = 0     # Persist every N streamed replies (0 → once, when the stream ends)
+BROADCAST_WORKERS = 0            # Process pool size for prompt broadcasts (0 → one per CPU core)
+BROADCAST_CHUNK = 2048           # Entities per worker task
+BROADCAST_MIN_PARALLEL = 4096    # Smaller broadcasts run inline; pool overhead would dominate
+
 # === SYSTEM SYMBOLS & GLYPHS ===
 SYSTEM_SIGILS = {
     "core_anchor": "☯",
@@ -114,6 +141,35 @@ SYSTEM_SIGILS = {
     "soulthread_weaving": "🪢",
     "symbolic_crack": "💔"
 }
+GLYPH_MEMO_SIZE = 16384          # extract_glyphs results kept per (text, min_len)
+
+# === LLM BRIDGE TRAFFIC ===
+LLM_MAX_CONCURRENCY = 8          # Remote calls in flight at once
+LLM_MAX_PENDING = 64             # Queued calls before new requests are deferred a tick
+LLM_POOL_SIZE = 16               # Keep-alive connections per endpoint host
+LLM_CONNECT_TIMEOUT = 5.0
+LLM_READ_TIMEOUT = 30.0
+LLM_DEADLINE = 60.0              # Wall-clock budget per call, retries included
+LLM_MAX_RETRIES = 4              # Extra attempts on 429/5xx and connection errors
+LLM_BACKOFF_BASE = 0.5           # Seconds; doubles per attempt, full jitter
+LLM_BACKOFF_MAX = 8.0
+LLM_CACHE_ENABLED = True         # Serve repeat (endpoint, model, system, prompt, temperature) calls from disk
+LLM_CACHE_DIR = "llm_cache"
+LLM_CACHE_TTL = 7 * 24 * 3600    # Seconds before a cached completion is re-requested (0 → never)
+LLM_CACHE_MAX_BYTES = 256 * 1024 * 1024
+LLM_RATE_LIMIT_ENABLED = True
+LLM_RATE_LIMITS = {              # Per-model budgets shared by every caller ("*" → any other model)
+    "gpt-4": {"rpm": 500, "tpm": 30000},
+    "deepseek-chat": {"rpm": 600, "tpm": 60000},
+}
+LLM_PRIORITY_RESERVE = {         # Fraction of each bucket a class may not spend (interactive > audit > bulk)
+    "interactive": 0.0,
+    "audit": 0.05,
+    "bulk": 0.15,
+}
+LLM_EST_OUTPUT_TOKENS = 400      # Completion allowance added to each request's prompt-length estimate
+AUDIT_LOG_DIR = "audit_logs"
+AUDIT_SEGMENT_BYTES = 64 * 1024 * 1024  # Audit records per append-only segment before rolling
 
 # === ADVANCED META-GOVERNANCE FLAGS ===
 ALLOW_MANUAL_ENTITY_PROMPTING = True
@@ -0,0 +1,219 @@
+# async_simulation.py
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from config.settings import (
+    SIM_CYCLES,
+    SIM_DELAY,
+    DRIFT_THRESHOLD,
+    ENABLE_AUTOMATED_AUDITS,
+    LLM_MAX_CONCURRENCY,
+    LLM_MAX_PENDING,
+    MAX_QUARANTINE_PER_CYCLE,
+    CYCLE_OVERDRIVE_MODE,
+)
+from core.dream_scheduler import DreamScheduler
+from core.simulation_phases import run_local_phases, run_cross_phases, barrier_summary
+from core.level_of_detail import LevelOfDetail
+from core.checkpoint import WorldCheckpointer
+from core.sentience_leaderboard import sentience_leaderboard
+
+# === LLM Backpressure ===
+
+class LLMGate:
+    """
+    Bounded-concurrency front for blocking LLM calls.
+
+    At most `max_concurrency` calls run at once on the I/O executor; once
+    `max_pending` calls are queued, submit() refuses new work so callers can
+    retry on a later tick instead of piling up behind a slow endpoint.
+    """
+
+    def __init__(self, max_concurrency=LLM_MAX_CONCURRENCY, max_pending=LLM_MAX_PENDING):
+        self.max_pending = max_pending
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="llm")
+        self.pending = set()
+        self.stats = {"submitted": 0, "completed": 0, "failed": 0, "deferred": 0}
+
+    def submit(self, fn, *args, on_done=None) -> bool:
+        if len(self.pending) >= self.max_pending:
+            self.stats["deferred"] += 1
+            return False
+        task = asyncio.get_running_loop().create_task(self._run(fn, args, on_done))
+        self.pending.add(task)
+        task.add_done_callback(self.pending.discard)
+        self.stats["submitted"] += 1
+        return True
+
+    async def _run(self, fn, args, on_done):
+        async with self.semaphore:
+            try:
+                result = await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+            except Exception as e:
+                self.stats["failed"] += 1
+                logging.warning(f"⚠️ LLM step {getattr(fn, '__name__', fn)} failed: {e}")
+                result = None
+        self.stats["completed"] += 1
+        if on_done:
+            on_done(result)
+
+    async def drain(self):
+        if self.pending:
+            await asyncio.gather(*list(self.pending))
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+
+# === LLM-Backed Steps ===
+# Steps receive a snapshot dict taken on the event loop, never the live entity,
+# so they can block in a worker thread while CPU phases keep mutating state.
+
+def audit_snapshot(entity) -> dict:
+    return {
+        "archetype": entity.archetype,
+        "tokens": entity.metadata.get("archetype_flags", []),
+        "memory": [entity.current_memory],
+        "drift": entity.drift_level,
+    }
+
+def audit_step(auditor, name, snapshot):
+    """Blocking: EntityAuditor rewrites the snapshot in place from its response."""
+    before = snapshot["drift"]
+    auditor.audit_entity(name, snapshot, store=False)
+    snapshot["drift_reduction"] = round(max(0.0, before - snapshot["drift"]), 6)
+    return snapshot
+
+def apply_audit(entity, snapshot):
+    # The snapshot's drift is stale by the time the audit lands; only the
+    # reduction the audit asked for is applied to the live value.
+    reduction = snapshot.get("drift_reduction", 0.0)
+    if reduction:
+        entity.set_drift(round(max(0.0, entity.drift_level - reduction), 3))
+    if snapshot.get("metaphor"):
+        entity.metadata["metaphor"] = snapshot["metaphor"]
+        entity.touch()
+    ritual = snapshot.get("memory", [""])[0]
+    if ritual.startswith("Ritual:"):
+        entity.crystal.embed(ritual)
+    sentience_leaderboard().update(entity)
+
+# === Per-Entity Behaviors ===
+
+async def audit_when_drifting(sim, entity):
+    """Queue a remote audit for drifting entities; never waits on the call itself."""
+    if not ENABLE_AUTOMATED_AUDITS or entity.drift_level < DRIFT_THRESHOLD:
+        return
+    if entity.id in sim.in_flight or entity.status != "active":
+        return
+    sim.request_llm(entity, audit_step, sim.auditor, entity.id, audit_snapshot(entity), apply=apply_audit)
+
+DEFAULT_BEHAVIORS = [audit_when_drifting]
+
+# === Simulation Driver ===
+
+class AsyncSimulation:
+    """
+    asyncio-driven simulation loop.
+
+    CPU-bound phases run on a single-thread executor so the event loop stays
+    responsive; per-entity behaviors are coroutines that may hand remote steps
+    to the LLM gate. LLM results are buffered and applied at the start of the
+    next tick, so they never race the CPU phases.
+    """
+
+    def __init__(self, entities, villages=None, behaviors=None, auditor=None,
+                 max_concurrency=LLM_MAX_CONCURRENCY, max_pending=LLM_MAX_PENDING,
+                 nations=None, checkpointer=None):
+        self.entities = list(entities)
+        self.villages = list(villages or [])
+        self.nations = list(nations or [])
+        # World checkpoints every AUTO_SAVE_INTERVAL ticks; checkpointer=False disables them
+        self.checkpointer = WorldCheckpointer() if checkpointer is None else checkpointer
+        self.behaviors = behaviors if behaviors is not None else DEFAULT_BEHAVIORS
+        self.auditor = auditor
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self.tick_count = 0
+        self.in_flight = set()
+        self.ready = []
+        self.gate = None
+        self.cpu = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sim-cpu")
+        self.dreams = DreamScheduler()
+        self.dreams.register_all(self.entities)
+        self.local_phases = LevelOfDetail().run_local_phases if CYCLE_OVERDRIVE_MODE else run_local_phases
+
+        if self.auditor is None and audit_when_drifting in self.behaviors:
+            from entity_auditor import EntityAuditor
+            self.auditor = EntityAuditor()
+
+    def request_llm(self, entity, fn, *args, apply=None) -> bool:
+        def done(result):
+            self.in_flight.discard(entity.id)
+            if result is not None and apply:
+                self.ready.append((apply, entity, result))
+
+        accepted = self.gate.submit(fn, *args, on_done=done)
+        if accepted:
+            self.in_flight.add(entity.id)
+        return accepted
+
+    def _apply_ready(self):
+        ready, self.ready = self.ready, []
+        for apply, entity, result in ready:
+            apply(entity, result)
+        return len(ready)
+
+    async def step(self):
+        if self.gate is None:
+            self.gate = LLMGate(self.max_concurrency, self.max_pending)
+        loop = asyncio.get_running_loop()
+        self.tick_count += 1
+
+        applied = self._apply_ready()
+        alerts = await loop.run_in_executor(
+            self.cpu, self.local_phases, self.entities, MAX_QUARANTINE_PER_CYCLE, self.dreams
+        )
+
+        await asyncio.gather(*(b(self, e) for e in self.entities for b in self.behaviors))
+
+        summaries = [barrier_summary(e) for e in self.entities]
+        fused = await loop.run_in_executor(self.cpu, run_cross_phases, self.entities, summaries, self.villages)
+        self.entities.extend(fused)
+        self.dreams.register_all(fused)
+
+        if self.checkpointer:
+            await loop.run_in_executor(
+                self.cpu, self.checkpointer.maybe_checkpoint,
+                self.tick_count, self.entities, self.villages, self.nations
+            )
+
+        logging.info(
+            f"🔁 Tick {self.tick_count}: {len(alerts)} alerts, {len(fused)} fusions, "
+            f"{applied} LLM results applied, {len(self.gate.pending)} in flight"
+        )
+        return alerts
+
+    async def run(self, cycles=SIM_CYCLES, delay=SIM_DELAY):
+        try:
+            for _ in range(cycles):
+                await self.step()
+                await asyncio.sleep(delay)
+            if self.gate is not None:
+                await self.gate.drain()
+            self._apply_ready()
+        finally:
+            self.close()
+        return self.entities
+
+    def close(self):
+        if self.gate:
+            self.gate.close()
+        self.cpu.shutdown(wait=False)
+
+
+def run_async_simulation(entities, cycles=SIM_CYCLES, **kwargs):
+    """Blocking convenience wrapper for scripts."""
+    return asyncio.run(AsyncSimulation(entities, **kwargs).run(cycles))
@@ -0,0 +1,126 @@
+# broadcast.py
+
+import os
+import logging
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+
+from config.settings import BROADCAST_WORKERS, BROADCAST_CHUNK, BROADCAST_MIN_PARALLEL
+from core.emotion_engine import EmotionState
+from core.prompt_interface import query_entity, record_turn, flush_turns
+from core.sentience_leaderboard import sentience_leaderboard
+from dialogue.text_synthesis import variable_responses
+from utils import rng_streams
+
+# Fan a prompt out to the whole population: entity shards are shipped to a
+# process pool as small snapshots, workers return replies plus the state
+# query_entity would have written, and the parent applies everything in one
+# batched commit. Workers never touch the dialogue store (each fork would own
+# a private copy of it); the parent records every turn while committing.
+# Small populations skip the pool entirely.
+
+_pool = None
+
+def broadcast_pool(workers=None) -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        ctx = mp.get_context("fork") if "fork" in mp.get_all_start_methods() else mp.get_context()
+        _pool = ProcessPoolExecutor(max_workers=workers or BROADCAST_WORKERS or os.cpu_count() or 1,
+                                    mp_context=ctx)
+    return _pool
+
+def shutdown_broadcast_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+def _shards(items, chunk):
+    return [items[i:i + chunk] for i in range(0, len(items), chunk)]
+
+def _shard_seeds(count):
+    # Seeded runs hand every shard its own derived seed, drawn in the parent
+    if rng_streams.current_seed() is None:
+        return [None] * count
+    rng = rng_streams.stream("dialogue")
+    return [rng.getrandbits(64) for _ in range(count)]
+
+def _worker_streams(seed):
+    if seed is None:
+        rng_streams.unseed_streams()
+    else:
+        rng_streams.seed_streams(seed)
+
+# === Simulation Entities ===
+
+class _PromptView:
+    """The slice of an Entity that query_entity reads and writes."""
+
+    def __init__(self, snapshot):
+        self.id, self.archetype, self.current_memory, self.drift_level, levels = snapshot
+        self.emotion = EmotionState()
+        self.emotion.levels = levels
+        self.metadata = {}
+
+def prompt_snapshot(entity):
+    return (entity.id, entity.archetype, entity.current_memory, entity.drift_level, dict(entity.emotion.levels))
+
+def _query_shard(snapshots, prompt, seed):
+    _worker_streams(seed)
+    results = []
+    for snapshot in snapshots:
+        view = _PromptView(snapshot)
+        reply = query_entity(view, prompt, record=False)
+        results.append((view.id, reply, view.current_memory, view.emotion.levels, view.metadata["dialogue_log"][-1]))
+    return results
+
+def commit_query_results(entities, results, prompt) -> dict:
+    """Apply gathered worker results and record their turns in one pass. Returns {entity_id: reply}."""
+    by_id = {e.id: e for e in entities}
+    replies = {}
+    for eid, reply, memory, levels, log_entry in results:
+        entity = by_id[eid]
+        entity.emotion.levels = levels
+        entity.emotion.version += 1
+        entity.current_memory = memory
+        entity.metadata.setdefault("dialogue_log", []).append(log_entry)
+        record_turn(entity, prompt, reply, flush=False)
+        replies[eid] = reply
+    if replies:
+        flush_turns()
+    sentience_leaderboard().update_many(by_id[eid] for eid in replies)
+    return replies
+
+def broadcast_query(entities, prompt, workers=None, chunk=BROADCAST_CHUNK) -> dict:
+    """query_entity for every entity, in parallel above BROADCAST_MIN_PARALLEL. Returns {entity_id: reply}."""
+    entities = list(entities)
+    if len(entities) < BROADCAST_MIN_PARALLEL:
+        return {e.id: query_entity(e, prompt) for e in entities}
+
+    shards = _shards([prompt_snapshot(e) for e in entities], chunk)
+    pool = broadcast_pool(workers)
+    futures = [pool.submit(_query_shard, shard, prompt, seed)
+               for shard, seed in zip(shards, _shard_seeds(len(shards)))]
+    results = [r for f in futures for r in f.result()]
+
+    replies = commit_query_results(entities, results, prompt)
+    logging.info(f"📣 Broadcast to {len(replies)} entities across {len(shards)} shards")
+    return replies
+
+# === Dashboard Replies ===
+
+def _synthesize_shard(specs, seed):
+    _worker_streams(seed)
+    return [str(r) for r in variable_responses(specs)]
+
+def broadcast_variable_responses(specs, workers=None, chunk=BROADCAST_CHUNK) -> list:
+    """variable_responses for many (tone, ess, drift) specs, rendered to strings in worker processes."""
+    specs = list(specs)
+    if len(specs) < BROADCAST_MIN_PARALLEL:
+        return variable_responses(specs)
+
+    shards = _shards(specs, chunk)
+    pool = broadcast_pool(workers)
+    futures = [pool.submit(_synthesize_shard, shard, seed)
+               for shard, seed in zip(shards, _shard_seeds(len(shards)))]
+    return [body for f in futures for body in f.result()]
@@ -0,0 +1,187 @@
+# checkpoint.py
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+from config.settings import AUTO_SAVE_INTERVAL, CHECKPOINT_DIR, CHECKPOINT_REBASE_INTERVAL
+from core.simulation_loop import Entity
+from civilization.village_engine import Village
+from environment.envgen import Nation, SymbolicArea
+
+# === Change Stamps ===
+# Entities carry version counters bumped at mutation time, so an unchanged
+# entity costs one tuple compare and is never serialized. The few hundred
+# village, nation, town and area records have no counters and are compared
+# by a digest of their serialized record instead.
+
+def entity_stamp(entity):
+    return entity.state_version()
+
+def record_signature(record) -> bytes:
+    blob = json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).digest()
+
+# === World Flattening ===
+
+def _town_record(town):
+    record = town.to_dict()
+    record["areas"] = [f"area:{town.name}:{i}" for i in range(len(town.areas))]
+    return record
+
+def _nation_record(nation):
+    record = {k: v for k, v in nation.to_dict().items() if k != "towns"}
+    record["towns"] = [t.name for t in nation.towns]
+    return record
+
+def world_objects(entities, villages, nations):
+    """Yield (key, record_fn, stamp_fn, obj) for every persistable object; stamp_fn None → digest the record."""
+    for e in entities:
+        yield f"entity:{e.id}", Entity.to_dict, entity_stamp, e
+    for v in villages:
+        yield f"village:{v.id}", Village.to_dict, None, v
+    for n in nations:
+        yield f"nation:{n.name}", _nation_record, None, n
+        for t in n.towns:
+            yield f"town:{t.name}", _town_record, None, t
+            for i, a in enumerate(t.areas):
+                yield f"area:{t.name}:{i}", SymbolicArea.to_dict, None, a
+
+# === Checkpoint Writer ===
+
+class WorldCheckpointer:
+    """
+    Base snapshot + append-only deltas for the whole world.
+
+    checkpoint() compares change stamps against the last write and appends
+    one compact JSON line holding only the changed and removed records. Every
+    `rebase_interval` deltas a fresh gzip base is written and the delta log
+    restarts, so restore never replays an unbounded history. The new base and
+    the emptied delta log are both staged as temp files and swapped in with
+    os.replace; restore ignores deltas not newer than the base, so a crash
+    between the two swaps loses nothing.
+    """
+
+    def __init__(self, directory=CHECKPOINT_DIR, interval=AUTO_SAVE_INTERVAL,
+                 rebase_interval=CHECKPOINT_REBASE_INTERVAL):
+        self.dir = Path(directory)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.interval = interval
+        self.rebase_interval = rebase_interval
+        self.stamps = {}
+        self.deltas_since_base = None
+
+    def maybe_checkpoint(self, tick, entities, villages=(), nations=()):
+        if tick % self.interval:
+            return None
+        return self.checkpoint(tick, entities, villages, nations)
+
+    def checkpoint(self, tick, entities, villages=(), nations=()):
+        start = time.perf_counter()
+        if self.deltas_since_base is None or self.deltas_since_base >= self.rebase_interval:
+            stats = self._write_base(tick, entities, villages, nations)
+        else:
+            stats = self._write_delta(tick, entities, villages, nations)
+        stats["ms"] = round((time.perf_counter() - start) * 1000, 2)
+        logging.info(f"📦 Checkpoint @ tick {tick}: {stats}")
+        return stats
+
+    def _write_base(self, tick, entities, villages, nations):
+        records, stamps = {}, {}
+        for key, rec_fn, stamp_fn, obj in world_objects(entities, villages, nations):
+            records[key] = rec_fn(obj)
+            stamps[key] = stamp_fn(obj) if stamp_fn else record_signature(records[key])
+
+        base_tmp = self.dir / "base.json.gz.tmp"
+        with gzip.open(base_tmp, "wt", encoding="utf-8") as f:
+            json.dump({"tick": tick, "records": records}, f, separators=(",", ":"))
+        deltas_tmp = self.dir / "deltas.jsonl.tmp"
+        deltas_tmp.write_text("")
+        os.replace(base_tmp, self.dir / "base.json.gz")
+        os.replace(deltas_tmp, self.dir / "deltas.jsonl")
+
+        self.stamps = stamps
+        self.deltas_since_base = 0
+        return {"kind": "base", "records": len(records)}
+
+    def _write_delta(self, tick, entities, villages, nations):
+        upsert, seen = {}, set()
+        for key, rec_fn, stamp_fn, obj in world_objects(entities, villages, nations):
+            seen.add(key)
+            if stamp_fn:
+                stamp = stamp_fn(obj)
+                if self.stamps.get(key) == stamp:
+                    continue
+                record = rec_fn(obj)
+            else:
+                record = rec_fn(obj)
+                stamp = record_signature(record)
+                if self.stamps.get(key) == stamp:
+                    continue
+            self.stamps[key] = stamp
+            upsert[key] = record
+        removed = [k for k in self.stamps if k not in seen]
+        for k in removed:
+            del self.stamps[k]
+
+        if upsert or removed:
+            line = json.dumps({"tick": tick, "upsert": upsert, "delete": removed}, separators=(",", ":"))
+            with open(self.dir / "deltas.jsonl", "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self.deltas_since_base += 1
+        return {"kind": "delta", "changed": len(upsert), "removed": len(removed)}
+
+# === Restore ===
+
+def load_records(directory=CHECKPOINT_DIR, until_tick=None):
+    """Replay base + deltas into a flat {key: record} map. Returns (tick, records)."""
+    directory = Path(directory)
+    with gzip.open(directory / "base.json.gz", "rt", encoding="utf-8") as f:
+        base = json.load(f)
+    tick, records = base["tick"], base["records"]
+
+    deltas = directory / "deltas.jsonl"
+    if deltas.exists():
+        with open(deltas, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                delta = json.loads(line)
+                if delta["tick"] <= base["tick"]:
+                    continue  # left over from before the current base
+                if until_tick is not None and delta["tick"] > until_tick:
+                    break
+                records.update(delta["upsert"])
+                for key in delta["delete"]:
+                    records.pop(key, None)
+                tick = delta["tick"]
+    return tick, records
+
+def restore_world(directory=CHECKPOINT_DIR, until_tick=None):
+    """Rebuild (tick, entities, villages, nations) from the latest checkpoint."""
+    tick, records = load_records(directory, until_tick)
+
+    entities, villages, nations = [], [], []
+    for key, record in records.items():
+        kind = key.split(":", 1)[0]
+        if kind == "entity":
+            entities.append(Entity.from_dict(record))
+        elif kind == "village":
+            villages.append(Village.from_dict(record))
+
+    for key, record in records.items():
+        if not key.startswith("nation:"):
+            continue
+        towns = []
+        for town_name in record.get("towns", []):
+            town_record = dict(records[f"town:{town_name}"])
+            town_record["areas"] = [records[k] for k in town_record.get("areas", []) if k in records]
+            towns.append(town_record)
+        nations.append(Nation.from_dict({**record, "towns": towns}))
+
+    logging.info(f"♻️ Restored tick {tick}: {len(entities)} entities, {len(villages)} villages, {len(nations)} nations")
+    return tick, entities, villages, nations
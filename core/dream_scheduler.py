@@ -0,0 +1,80 @@
+# dream_scheduler.py
+
+import logging
+from datetime import datetime
+
+from core.dream_state import DREAM_LAYERS, DREAM_TRANSITIONS, perform_dream_blooms
+from utils.timer_wheel import TimerWheel
+
+
+def cycles_until_transition(dream) -> int:
+    """Ticks of DreamState.evolve() needed before the current layer transitions."""
+    _, required = DREAM_TRANSITIONS.get(dream.current_layer, (None, 0))
+    if dream.current_layer not in DREAM_LAYERS:
+        return 1
+    return max(1, required - dream.cycles_in)
+
+
+class DreamScheduler:
+    """
+    Timer-wheel replacement for calling DreamState.evolve on every entity.
+
+    Each registered entity has exactly one pending timer: its next layer
+    transition. advance() fires only the due timers, batches the bloom
+    mutations for the tick, and logs a single summary line.
+    """
+
+    def __init__(self, slots=64, levels=3):
+        self.wheel = TimerWheel(slots=slots, levels=levels)
+        self.generation = {}
+
+    def register(self, entity):
+        self.reschedule(entity)
+
+    def register_all(self, entities):
+        for entity in entities:
+            self.reschedule(entity)
+
+    def reschedule(self, entity):
+        """(Re)arm the entity's timer — call after an external DreamState.enter()."""
+        gen = self.generation.get(entity.id, 0) + 1
+        self.generation[entity.id] = gen
+        self.wheel.schedule_in((entity, entity.dream.current_layer, gen), cycles_until_transition(entity.dream))
+
+    def forget(self, entity):
+        self.generation.pop(entity.id, None)
+
+    def advance(self):
+        """Advance one tick. Returns the entities whose layer changed."""
+        due = self.wheel.advance()
+        if not due:
+            return []
+
+        now = datetime.now()
+        moved, blooming = [], []
+        for entity, layer, gen in due:
+            if self.generation.get(entity.id) != gen:
+                continue  # superseded or forgotten
+            dream = entity.dream
+            if dream.current_layer != layer:
+                self.reschedule(entity)  # layer was changed from outside
+                continue
+
+            next_layer, required = DREAM_TRANSITIONS[layer]
+            if layer in DREAM_LAYERS:
+                dream.cycles_in = required
+            if layer == "bloom":
+                blooming.append(entity)
+            moved.append((entity, next_layer))
+
+        perform_dream_blooms(blooming)
+        for entity, next_layer in moved:
+            entity.dream.enter(next_layer, at=now, log=False)
+            self.reschedule(entity)
+
+        if moved:
+            logging.info(f"🌀 Dream tick {self.wheel.now}: {len(moved)} transitions, {len(blooming)} blooms")
+        return [entity for entity, _ in moved]
+
+    def __len__(self):
+        return len(self.generation)
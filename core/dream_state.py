@@ -1,50 +1,73 @@
-import random
 import logging
 from datetime import datetime
-from utils.glyph_parser import extract_glyphs
+from utils.glyph_parser import extract_glyphs, extract_glyphs_many
+from utils.rng_streams import stream
 from inventory.inventory_engine import generate_item  # ✅ ONLY import generate_item
 
 DREAM_LAYERS = ["silent", "drift", "bloom"]
 
+# layer → (next layer, cycles required before leaving)
+DREAM_TRANSITIONS = {
+    "active": ("silent", 0),
+    "silent": ("drift", 2),
+    "drift": ("bloom", 2),
+    "bloom": ("active", 1),
+}
+
 class DreamState:
     def __init__(self):
         self.current_layer = "active"
         self.entered = datetime.now()
         self.cycles_in = 0
         self.layer_log = []
+        self.version = 0  # bumped on every write; read by checkpoint change tracking
 
-    def enter(self, layer: str):
+    def enter(self, layer: str, at: datetime = None, log: bool = True):
         self.current_layer = layer
-        self.entered = datetime.now()
+        self.entered = at or datetime.now()
         self.cycles_in = 0
         self.layer_log.append((layer, self.entered))
-        logging.info(f"🌀 Dream Layer: Entered '{layer.upper()}' at {self.entered.isoformat()}")
+        self.version += 1
+        if log:
+            logging.info(f"🌀 Dream Layer: Entered '{layer.upper()}' at {self.entered.isoformat()}")
 
     def tick(self):
         if self.current_layer in DREAM_LAYERS:
             self.cycles_in += 1
+            self.version += 1
             logging.debug(f"  ↪ Dream Layer '{self.current_layer}' → {self.cycles_in} cycles")
 
     def evolve(self, entity):
         """Advance through dream layers and perform symbolic mutations."""
         self.tick()
 
-        transitions = {
-            "active": ("silent", 0),
-            "silent": ("drift", 2),
-            "drift": ("bloom", 2),
-            "bloom": ("active", 1),
-        }
-
-        if self.current_layer in transitions:
-            next_layer, required_cycles = transitions[self.current_layer]
+        if self.current_layer in DREAM_TRANSITIONS:
+            next_layer, required_cycles = DREAM_TRANSITIONS[self.current_layer]
             if self.cycles_in >= required_cycles:
                 if self.current_layer == "bloom":
                     perform_dream_bloom(entity)
                 self.enter(next_layer)
 
 
-def perform_dream_bloom(entity):
+    def to_dict(self):
+        return {
+            "current_layer": self.current_layer,
+            "entered": self.entered.isoformat(),
+            "cycles_in": self.cycles_in,
+            "layer_log": [(layer, at.isoformat()) for layer, at in self.layer_log],
+        }
+
+    @staticmethod
+    def from_dict(data):
+        dream = DreamState()
+        dream.current_layer = data.get("current_layer", "active")
+        dream.entered = datetime.fromisoformat(data.get("entered", dream.entered.isoformat()))
+        dream.cycles_in = data.get("cycles_in", 0)
+        dream.layer_log = [(layer, datetime.fromisoformat(at)) for layer, at in data.get("layer_log", [])]
+        return dream
+
+
+def perform_dream_bloom(entity, timestamp: str = None, log: bool = True):
     """Triggers mutation and symbolic reward during bloom."""
     if not hasattr(entity, "current_memory") or not entity.current_memory:
         logging.warning(f"⚠️ Entity {entity.id} lacks current_memory for dream mutation.")
@@ -55,20 +78,33 @@ def perform_dream_bloom(entity):
         logging.warning(f"⚠️ No motifs found to mutate for {entity.id}")
         return
 
-    selected = random.choice(glyphs)
+    selected = stream("dream").choice(glyphs)
     new_phrase = f"{selected} fractal echoes of what was once forgotten"
     old_memory = entity.current_memory
 
     entity.update_memory(new_phrase)
     entity.set_drift(0.1)
     entity.status = "active"
+    entity.touch()
     entity.metadata.update({
         "bloomed_from": old_memory,
         "bloomed_into": new_phrase,
-        "bloom_timestamp": datetime.now().isoformat()
+        "bloom_timestamp": timestamp or datetime.now().isoformat()
     })
 
     reward_item = generate_item(rarity="rare", source="dream_bloom")
     entity.gain_item(reward_item["name"], rarity=reward_item["rarity"], props=reward_item.get("properties"))
 
-    logging.info(f"🌸 Dream Bloom for {entity.id}: '{old_memory}' → '{new_phrase}' + 🎁 Item gained: {reward_item['name']}")
+    if log:
+        logging.info(f"🌸 Dream Bloom for {entity.id}: '{old_memory}' → '{new_phrase}' + 🎁 Item gained: {reward_item['name']}")
+    return True
+
+
+def perform_dream_blooms(entities):
+    """Bloom a whole tick's worth of entities with one timestamp and one log line."""
+    timestamp = datetime.now().isoformat()
+    extract_glyphs_many([e.current_memory for e in entities])  # warm the glyph memo in one pass
+    bloomed = sum(1 for e in entities if perform_dream_bloom(e, timestamp=timestamp, log=False))
+    if entities:
+        logging.info(f"🌸 Dream Bloom batch: {bloomed}/{len(entities)} entities bloomed")
+    return bloomed
@@ -1,4 +1,4 @@
-import random
+from utils.rng_streams import stream
 
 NEUROCHEMICALS = [
     "serotonin",      # mood, well-being
@@ -27,34 +27,50 @@ DEFAULT_LEVELS = {
     "cortisol": 0.5  # typically lower when relaxed
 }
 
+# Per-tick level shift per unit of drift (neurochemicals not listed are drift-neutral)
+DRIFT_SENSITIVITY = {
+    "serotonin": -0.02,
+    "dopamine":  0.015,
+    "cortisol":  0.025,
+    "GABA":     -0.015,
+    "glutamate": 0.02
+}
+
 class EmotionState:
     def __init__(self):
         self.levels = DEFAULT_LEVELS.copy()
+        self.version = 0  # bumped on every write; read by checkpoint change tracking
 
     def mutate(self, drift_factor: float = 0.0):
         """Apply nuanced modulation per neurotransmitter influenced by drift."""
+        rng = stream("emotion")
         for key in self.levels:
             # Random fluctuation
-            fluctuation = random.uniform(-0.05, 0.05)
+            fluctuation = rng.uniform(-0.05, 0.05)
             # Custom drift sensitivities
-            drift_influence = {
-                "serotonin": -0.02 * drift_factor,
-                "dopamine":  0.015 * drift_factor,
-                "cortisol":  0.025 * drift_factor,
-                "GABA":     -0.015 * drift_factor,
-                "glutamate": 0.02 * drift_factor
-            }.get(key, 0.0)
+            drift_influence = DRIFT_SENSITIVITY.get(key, 0.0) * drift_factor
 
             # Update level within bounded range
             new_value = self.levels[key] + fluctuation + drift_influence
             self.levels[key] = max(0.0, min(1.5, new_value))
+        self.version += 1
 
     def set(self, key, value):
         if key in self.levels:
             self.levels[key] = max(0.0, min(1.5, value))
+            self.version += 1
 
     def get(self, key):
         return self.levels.get(key, 0.0)
 
     def summary(self):
         return {k: round(v, 2) for k, v in self.levels.items()}
+
+    def to_dict(self):
+        return dict(self.levels)
+
+    @staticmethod
+    def from_dict(data):
+        state = EmotionState()
+        state.levels.update(data or {})
+        return state
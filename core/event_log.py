@@ -0,0 +1,173 @@
+# event_log.py
+
+import json
+import logging
+from collections import defaultdict
+from pathlib import Path
+
+from config.settings import EVENT_LOG_PATH
+from core.simulation_loop import Entity
+from core.simulation_phases import run_tick
+from core.prompt_interface import query_entity
+from core.async_simulation import apply_audit
+from core.sentience_leaderboard import sentience_leaderboard
+from civilization.village_engine import Village
+from dialogue.prompt_injection import apply_prompt_injection
+from drift.drift_engine import quarantined_entities
+from utils import rng_streams
+
+# === External Event Handlers ===
+# Everything that reaches an entity from outside the tick loop goes through one
+# of these, both live and during replay, so both paths mutate state identically.
+
+def _apply_edit(entity, data):
+    for field, value in data.items():
+        if field == "drift_level":
+            entity.set_drift(value)
+        elif field == "current_memory":
+            entity.update_memory(value)
+        else:
+            setattr(entity, field, value)
+    sentience_leaderboard().update(entity)
+
+EVENT_HANDLERS = {
+    "prompt": lambda entity, data: query_entity(entity, data["prompt"]),
+    "injection": lambda entity, data: apply_prompt_injection(entity, data["prompt"]),
+    "edit": _apply_edit,
+    "audit": apply_audit,  # data is the audited snapshot, so no remote call on replay
+}
+
+# Replayed prompts already sit in the dialogue store from the live run
+REPLAY_HANDLERS = {
+    **EVENT_HANDLERS,
+    "prompt": lambda entity, data: query_entity(entity, data["prompt"], record=False),
+}
+
+# === Event Log ===
+
+class EventLog:
+    """Append-only JSONL: a genesis line with the seed and initial world, then one line per event."""
+
+    def __init__(self, path=EVENT_LOG_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def genesis(self, seed, entities, villages=()):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "kind": "genesis",
+                "tick": 0,
+                "seed": seed,
+                "entities": [e.to_dict() for e in entities],
+                "villages": [v.to_dict() for v in villages],
+            }, separators=(",", ":")) + "\n")
+
+    def append(self, tick, kind, entity_id, data):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"tick": tick, "kind": kind, "entity": entity_id, "data": data},
+                               separators=(",", ":")) + "\n")
+
+def read_events(log):
+    """Accept a path or an already-loaded list of event dicts."""
+    if isinstance(log, (list, tuple)):
+        return list(log)
+    with open(log, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+# === Deterministic Run ===
+
+class DeterministicRun:
+    """
+    Single-process simulation with seeded subsystem streams and a recorded event log.
+
+    External actions are queued with inject() and applied at the start of the
+    next tick, before its phases, which is exactly where replay applies them.
+    """
+
+    def __init__(self, seed, entities, villages=(), log_path=EVENT_LOG_PATH, checkpointer=None):
+        rng_streams.seed_streams(seed)
+        quarantined_entities.clear()
+        self.seed = seed
+        self.entities = list(entities)
+        self.villages = list(villages)
+        self.by_id = {e.id: e for e in self.entities}
+        self.tick = 0
+        self.queue = []
+        self.checkpointer = checkpointer
+        self.log = EventLog(log_path)
+        self.log.genesis(seed, self.entities, self.villages)
+
+    def inject(self, kind, entity_id, **data):
+        if kind not in EVENT_HANDLERS:
+            raise ValueError(f"Unknown event kind: {kind}")
+        self.queue.append((kind, entity_id, data))
+
+    def step(self):
+        self.tick += 1
+        queued, self.queue = self.queue, []
+        for kind, entity_id, data in queued:
+            entity = self.by_id.get(entity_id)
+            if entity is None:
+                logging.warning(f"⚠️ Event {kind} for unknown entity {entity_id} dropped")
+                continue
+            EVENT_HANDLERS[kind](entity, data)
+            self.log.append(self.tick, kind, entity_id, data)
+
+        alerts, fused = run_tick(self.entities, self.villages)
+        self.entities.extend(fused)
+        self.by_id.update((e.id, e) for e in fused)
+        if self.checkpointer:
+            self.checkpointer.maybe_checkpoint(self.tick, self.entities, self.villages)
+        return alerts
+
+    def run(self, cycles):
+        for _ in range(cycles):
+            self.step()
+        return self.entities
+
+# === Replay ===
+
+def replay(seed, log, until_tick=None):
+    """
+    Rebuild the world as it stood after `until_tick` (default: last logged tick).
+
+    Only the tick loop and recorded events are re-executed: no LLM calls, no
+    saves, and logging up to WARNING is muted. Stream positions and the drift engine's
+    quarantine set are restored afterwards, so a live run in the same process
+    is unaffected.
+    """
+    events = read_events(log)
+    genesis, events = events[0], events[1:]
+    if genesis.get("kind") != "genesis":
+        raise ValueError("Event log does not start with a genesis record")
+    seed = genesis["seed"] if seed is None else seed
+
+    by_tick = defaultdict(list)
+    for event in events:
+        by_tick[event["tick"]].append(event)
+    last = until_tick if until_tick is not None else max(by_tick, default=0)
+
+    saved_streams = rng_streams.get_state()
+    saved_quarantine = set(quarantined_entities)
+    saved_disable = logging.root.manager.disable
+    logging.disable(max(saved_disable, logging.WARNING))
+    try:
+        rng_streams.seed_streams(seed)
+        quarantined_entities.clear()
+        entities = [Entity.from_dict(d) for d in genesis["entities"]]
+        villages = [Village.from_dict(d) for d in genesis["villages"]]
+        by_id = {e.id: e for e in entities}
+
+        for tick in range(1, last + 1):
+            for event in by_tick.get(tick, []):
+                REPLAY_HANDLERS[event["kind"]](by_id[event["entity"]], event["data"])
+            _, fused = run_tick(entities, villages)
+            entities.extend(fused)
+            by_id.update((e.id, e) for e in fused)
+    finally:
+        rng_streams.set_state(saved_streams)
+        quarantined_entities.clear()
+        quarantined_entities.update(saved_quarantine)
+        logging.disable(saved_disable)
+
+    return entities, villages
@@ -1,5 +1,5 @@
 import logging
-from core.entity import Entity
+from core.simulation_loop import Entity
 from collections import defaultdict
 from itertools import combinations
 from datetime import datetime
@@ -38,14 +38,6 @@ def compute_coherence(set1, set2):
     return len(intersection) / len(union)
 
 def fuse_entities(e1, e2, shared_motifs):
-    if not isinstance(entity_a, dict) or not isinstance(entity_b, dict):
-        raise TypeError('Entities must be dictionaries to fuse')
-    # Simple fusion strategy: A takes priority, B fills gaps
-    fused = entity_a.copy()
-    for k, v in entity_b.items():
-        if k not in fused or fused[k] in [None, '', []]:
-            fused[k] = v
-    return fused
     merged_memory = f"{e1.current_memory} + {e2.current_memory}"
     merged_entity = Entity(memory_snapshot=merged_memory, archetype="mythic_nexus")
 
@@ -63,6 +55,7 @@ def fuse_entities(e1, e2, shared_motifs):
         extract_glyphs_from_crystal(e1.crystal), extract_glyphs_from_crystal(e2.crystal))
 
     logging.info(f"⚡ Fusion Event: {e1.id} + {e2.id} → {merged_entity.id} with {len(shared_motifs)} shared motifs")
+    return merged_entity
 
 def run_fusion_cycle(entities):
     fusions = []
@@ -78,3 +71,5 @@ def run_fusion_cycle(entities):
 
         if len(fusions) >= MAX_FUSIONS_PER_CYCLE:
             break
+
+    return fusions
@@ -0,0 +1,126 @@
+# interaction_scheduler.py
+
+from collections import defaultdict
+
+from config.settings import MAX_ENTITY_INTERACTIONS_PER_CYCLE
+from utils.rng_streams import stream
+
+# === Locality ===
+# Entities are only paired inside the tightest group they share: same village,
+# then same area, then same leading glyph. Anything without a locality falls
+# into the "wild" pool and is paired at random, as the arena always did.
+
+def locality_key(summary) -> tuple:
+    if summary.get("village"):
+        return ("village", str(summary["village"]))
+    if summary.get("area"):
+        return ("area", str(summary["area"]))
+    if summary.get("motifs"):
+        return ("glyph", min(summary["motifs"]))
+    return ("wild", "")
+
+def _quotas(sizes: dict, budget: int, rng=None) -> dict:
+    """
+    Split `budget` across groups in proportion to their pair counts. Whole
+    shares are granted outright; the leftover units go by systematic sampling
+    over the fractional parts in a shuffled order, so each group wins an extra
+    slot with probability equal to its fraction and small groups rotate in
+    from tick to tick instead of the lowest keys always taking them.
+    """
+    total = sum(sizes.values())
+    if total <= budget:
+        return dict(sizes)
+    rng = rng or stream("arena")
+    shares = {k: budget * n / total for k, n in sizes.items()}
+    quotas = {k: int(s) for k, s in shares.items()}
+
+    keys = sorted(shares)
+    rng.shuffle(keys)
+    acc = rng.random()
+    for k in keys:
+        before = int(acc)
+        acc += shares[k] - quotas[k]
+        if int(acc) > before:
+            quotas[k] += 1
+
+    # float rounding can leave the walk one unit short
+    short = budget - sum(quotas.values())
+    for k in keys:
+        if short <= 0:
+            break
+        if quotas[k] < sizes[k] and quotas[k] <= shares[k]:
+            quotas[k] += 1
+            short -= 1
+    return quotas
+
+# === Work List ===
+
+class WorkList:
+    """
+    Interaction pairs as parallel id columns, ordered group by group so each
+    batch touches one locality's entities back to back. `groups` holds
+    (key, start, end) slices into the columns.
+    """
+
+    def __init__(self):
+        self.left = []
+        self.right = []
+        self.groups = []
+
+    def extend(self, key, pairs):
+        if not pairs:
+            return
+        start = len(self.left)
+        for a, b in pairs:
+            self.left.append(a)
+            self.right.append(b)
+        self.groups.append((key, start, len(self.left)))
+
+    def batches(self):
+        for key, start, end in self.groups:
+            yield key, self.left[start:end], self.right[start:end]
+
+    def __len__(self):
+        return len(self.left)
+
+    def __iter__(self):
+        return zip(self.left, self.right)
+
+def schedule_interactions(summaries, budget=MAX_ENTITY_INTERACTIONS_PER_CYCLE, hot_ids=None) -> WorkList:
+    """
+    Pair active entities by locality under the per-cycle budget.
+
+    Each locality gets a share of the budget proportional to how many pairs it
+    could form. Within a group, entities in `hot_ids` (already touched this
+    tick) are paired first. Leftover singles from every group are pooled and
+    paired only if budget remains.
+    """
+    hot_ids = hot_ids or set()
+    rng = stream("arena")
+
+    groups = defaultdict(list)
+    for s in summaries:
+        if s["status"] == "active":
+            groups[locality_key(s)].append(s["id"])
+
+    paired = {}
+    leftovers = []
+    for key in sorted(groups):
+        ids = sorted(groups[key])
+        rng.shuffle(ids)
+        ids.sort(key=lambda i: i not in hot_ids)  # stable: hot first, shuffled within
+        paired[key] = [(ids[i], ids[i + 1]) for i in range(0, len(ids) - 1, 2)]
+        if len(ids) % 2:
+            leftovers.append(ids[-1])
+
+    work = WorkList()
+    quotas = _quotas({k: len(p) for k, p in paired.items() if p}, budget, rng)
+    for key in sorted(quotas):
+        work.extend(key, paired[key][:quotas[key]])
+
+    remaining = budget - len(work)
+    if remaining > 0 and len(leftovers) > 1:
+        rng.shuffle(leftovers)
+        work.extend(("mixed", ""), [(leftovers[i], leftovers[i + 1])
+                                    for i in range(0, len(leftovers) - 1, 2)][:remaining])
+    return work
@@ -0,0 +1,118 @@
+# level_of_detail.py
+
+import math
+import zlib
+import logging
+
+from config.settings import (
+    ENTITY_DREAM_STATE_ENABLED,
+    MAX_QUARANTINE_PER_CYCLE,
+    LOD_COARSE_INTERVAL,
+)
+from core.emotion_engine import DRIFT_SENSITIVITY
+from core.simulation_phases import run_local_phases
+from drift.drift_engine import run_drift_scan, memory_drift_moments
+from quests.quest_engine import progress_quest
+from utils.rng_streams import stream
+
+LOD_TIERS = ["active", "dormant", "quarantined", "offscreen"]
+
+def lod_tier(entity, visible_ids=None) -> str:
+    if entity.status == "quarantined":
+        return "quarantined"
+    if entity.status == "dormant":
+        return "dormant"
+    if entity.metadata.get("offscreen") or (visible_ids is not None and entity.id not in visible_ids):
+        return "offscreen"
+    return "active"
+
+# === Closed-Form Skips ===
+
+def skip_emotion(emotion, drift_factor: float, ticks: int):
+    """
+    `ticks` calls of EmotionState.mutate collapsed into one draw per level:
+    the drift pull adds up linearly and the sum of U(-0.05, 0.05) fluctuations
+    is taken as Gaussian with the matching variance.
+    """
+    rng = stream("emotion")
+    sigma = 0.05 * math.sqrt(ticks / 3)
+    for key, level in emotion.levels.items():
+        pull = DRIFT_SENSITIVITY.get(key, 0.0) * drift_factor * ticks
+        emotion.levels[key] = max(0.0, min(1.5, level + pull + rng.gauss(0.0, sigma)))
+    emotion.version += 1
+
+def skip_drift(entity, ticks: int):
+    """
+    `ticks` rounds of run_drift_scan's update x ← (x + d) / 2 in closed form:
+    x_k = x_0·2⁻ᵏ + E[d]·(1 − 2⁻ᵏ), with variance Var[d]·(1 − 4⁻ᵏ)/3.
+    Quarantine decisions are not taken here; the caller runs one real scan.
+    """
+    if ticks <= 0:
+        return
+    mean, variance = memory_drift_moments(entity)
+    decay = 0.5 ** ticks
+    expected = entity.drift_level * decay + mean * (1 - decay)
+    sigma = math.sqrt(variance * (1 - decay * decay) / 3)
+    entity.set_drift(round(expected + stream("drift").gauss(0.0, sigma), 3))
+
+# === Tiered Scheduler ===
+
+class LevelOfDetail:
+    """
+    Drop-in replacement for run_local_phases that simulates only active
+    entities every tick. Dormant, quarantined and off-screen entities are
+    spread over `interval` buckets by id; each tick one bucket takes a coarse
+    step covering every tick it missed: emotion and drift are integrated in
+    closed form, then a single real drift scan (with quarantine checks) and at
+    most one quest step run for the whole bucket.
+    """
+
+    def __init__(self, interval=LOD_COARSE_INTERVAL, visible_ids=None):
+        self.interval = max(1, interval)
+        self.visible_ids = visible_ids
+        self.tick = 0
+        self.last_step = {}
+        self.stats = dict.fromkeys(LOD_TIERS, 0)
+
+    def bucket(self, entity) -> int:
+        return zlib.crc32(entity.id.encode()) % self.interval
+
+    def run_local_phases(self, entities, max_quarantine=MAX_QUARANTINE_PER_CYCLE, dreams=None):
+        self.tick += 1
+        stats = dict.fromkeys(LOD_TIERS, 0)
+        fine, coarse = [], []
+        due_bucket = self.tick % self.interval
+
+        for entity in entities:
+            tier = lod_tier(entity, self.visible_ids)
+            stats[tier] += 1
+            if tier == "active":
+                fine.append(entity)
+                self.last_step[entity.id] = self.tick
+            elif self.bucket(entity) == due_bucket:
+                coarse.append(entity)
+        self.stats = stats
+
+        alerts = run_local_phases(fine, max_quarantine=max_quarantine, dreams=dreams)
+        if coarse:
+            alerts += self._coarse_step(coarse, max(0, max_quarantine - len(alerts)), dreams)
+
+        logging.debug(f"🔭 LOD tick {self.tick}: {len(fine)} fine, {len(coarse)} coarse, tiers {stats}")
+        return alerts
+
+    def _coarse_step(self, entities, max_quarantine, dreams):
+        for entity in entities:
+            missed = self.tick - self.last_step.get(entity.id, self.tick - self.interval)
+            self.last_step[entity.id] = self.tick
+            skip_emotion(entity.emotion, entity.drift_level, missed)
+            if ENTITY_DREAM_STATE_ENABLED and dreams is None:
+                for _ in range(missed):
+                    entity.dream.evolve(entity)
+            skip_drift(entity, missed - 1)
+
+        alerts = run_drift_scan(entities, max_quarantine=max_quarantine)
+
+        for entity in entities:
+            if entity.status == "active":
+                progress_quest(entity)
+        return alerts
@@ -2,6 +2,10 @@ import random
 import html
 from dialogue.symbolic_speech import spawn_symbolic_branch
 from dialogue.dialogue_engine import generate_dialogue
+from dialogue.response_cache import response_cache
+from dialogue.dialogue_store import dialogue_store
+from core.sentience_leaderboard import sentience_leaderboard
+from config.settings import DIALOGUE_STORE_ENABLED, DIALOGUE_LOG_INLINE
 
 
 def sanitize_text(text: str) -> str:
@@ -11,33 +15,68 @@ def sanitize_text(text: str) -> str:
     return html.escape(text).replace("\n", "<br>")
 
 
-def query_entity(entity, prompt: str) -> str:
+def _clean(text: str) -> str:
+    return text.strip().replace("\r", "")
+
+
+def flush_turns():
+    """Push recorded turns out of the dialogue store's write buffer."""
+    if DIALOGUE_STORE_ENABLED:
+        dialogue_store().flush()
+
+
+def record_turn(entity, prompt: str, reply: str, record: bool = True, flush: bool = True):
+    """
+    With the dialogue store on, persist one exchange (unless `record` is off)
+    and trim the inline dialogue_log to DIALOGUE_LOG_INLINE entries. The turn
+    is flushed to disk unless `flush` is off (batch callers flush once).
+    """
+    if not DIALOGUE_STORE_ENABLED:
+        return
+    if record:
+        dialogue_store().record(entity.id, _clean(prompt), _clean(reply))
+        if flush:
+            flush_turns()
+    del entity.metadata.setdefault("dialogue_log", [])[:-DIALOGUE_LOG_INLINE]
+
+
+def query_entity(entity, prompt: str, record: bool = True) -> str:
     """
     Accepts a multiline prompt and returns a symbolic or memory-reactive response.
     Supports drift-based symbolic speech or mythic logic reflection.
+    record=False leaves the dialogue store and leaderboard untouched (replay,
+    forked workers); the leaderboard's refresh() picks those changes up.
     """
     # Apply emotional mutation based on symbolic drift
     entity.emotion.mutate(drift_factor=entity.drift_level)
 
+    cache = response_cache()
+
     # Symbolic Fragment Mode
     if entity.drift_level > 0.5:
-        fragments = spawn_symbolic_branch(entity)
-        reply = "\n".join(fragments)
+        reply = cache.cached(
+            entity, "symbolic",
+            lambda e, rng: "\n".join(spawn_symbolic_branch(e, rng)),
+            uses_rng=True,
+        )
 
     # Mythopoetic Reflection
     elif "?" in prompt or "why" in prompt.lower():
-        reply = generate_dialogue(entity)
+        reply = cache.cached(entity, "mythic", lambda e, rng: generate_dialogue(e))
 
     # Default Recall
     else:
         reply = f"{entity.id} says:\n{entity.current_memory}"
 
     # Store memory exchange formatted for future processing/logging
-    formatted_prompt = prompt.strip().replace("\r", "")
-    formatted_reply = reply.strip().replace("\r", "")
+    formatted_prompt = _clean(prompt)
+    formatted_reply = _clean(reply)
     memory_entry = f"💭 Prompt:\n{formatted_prompt}\n→ Reply:\n{formatted_reply}"
 
     entity.current_memory = formatted_reply  # Update core memory trace
     entity.metadata.setdefault("dialogue_log", []).append(memory_entry)
+    record_turn(entity, formatted_prompt, formatted_reply, record=record)
+    if record:
+        sentience_leaderboard().update(entity)
 
     return reply
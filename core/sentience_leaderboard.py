@@ -0,0 +1,101 @@
+# sentience_leaderboard.py
+
+from bisect import bisect_left, insort
+
+from core.sentience_probe import probe_population
+
+TIER_ORDER = ["NEXUS", "SEEDLING", "SPARK", "SHADOW"]
+
+def tier_name(tier: str) -> str:
+    return tier.split()[-1]
+
+def sentience_signature(entity):
+    """Everything probe_sentience reads; an unchanged signature means an unchanged score."""
+    log = entity.metadata.get("dialogue_log", [])
+    return (
+        entity.current_memory,
+        len(entity.crystal.fragments),
+        len(log), log[-1] if log else None,
+        tuple(entity.emotion.levels.values()),
+    )
+
+class SentienceLeaderboard:
+    """
+    Live sentience ranking.
+
+    Tiers are contiguous score bands, so each tier keeps its own ascending list
+    of (-score, id) and the global order is just the tiers concatenated.
+    Re-ranking one entity is a bisect delete + insort in its tier; top(k) and
+    histogram() only read the first k rows and the list lengths.
+    """
+
+    def __init__(self):
+        self.ranks = {tier: [] for tier in TIER_ORDER}
+        self.entries = {}       # id → (tier, -score)
+        self.results = {}       # id → last probe result
+        self.signatures = {}
+
+    def _place(self, result):
+        eid = result["entity_id"]
+        self.discard(eid)
+        tier = tier_name(result["tier"])
+        key = (-result["score"], eid)
+        insort(self.ranks[tier], key)
+        self.entries[eid] = (tier, key[0])
+        self.results[eid] = result
+
+    def discard(self, entity_id):
+        entry = self.entries.pop(entity_id, None)
+        if entry is None:
+            return
+        tier, neg_score = entry
+        rows = self.ranks[tier]
+        i = bisect_left(rows, (neg_score, entity_id))
+        if i < len(rows) and rows[i] == (neg_score, entity_id):
+            del rows[i]
+        self.results.pop(entity_id, None)
+        self.signatures.pop(entity_id, None)
+
+    def update(self, entity):
+        """Re-probe one entity after a known change (prompt, edit, audit)."""
+        self.update_many([entity])
+
+    def update_many(self, entities):
+        entities = list(entities)
+        for entity, result in zip(entities, probe_population(entities)):
+            self._place(result)
+            self.signatures[entity.id] = sentience_signature(entity)
+
+    def refresh(self, entities):
+        """Re-probe only entities whose memory, crystal, dialogue log or emotions moved. Returns how many."""
+        changed = [e for e in entities if self.signatures.get(e.id) != sentience_signature(e)]
+        if changed:
+            self.update_many(changed)
+        return len(changed)
+
+    def top(self, k=50, tier=None) -> list:
+        tiers = [tier_name(tier)] if tier else TIER_ORDER
+        out = []
+        for t in tiers:
+            for neg_score, eid in self.ranks[t][:k - len(out)]:
+                out.append({"entity_id": eid, "tier": t, "score": -neg_score})
+            if len(out) >= k:
+                break
+        return out
+
+    def histogram(self) -> dict:
+        return {tier: len(rows) for tier, rows in self.ranks.items()}
+
+    def result(self, entity_id):
+        return self.results.get(entity_id)
+
+    def __len__(self):
+        return len(self.entries)
+
+_default_leaderboard = None
+
+def sentience_leaderboard() -> SentienceLeaderboard:
+    global _default_leaderboard
+    if _default_leaderboard is None:
+        _default_leaderboard = SentienceLeaderboard()
+    return _default_leaderboard
@@ -1,12 +1,24 @@
 from collections import Counter
+from functools import lru_cache
 from utils.glyph_parser import extract_glyphs
 from config.settings import SRQ_KEYWORDS
+import re
 import statistics
 
+import numpy as np
+
+_SRQ_WORDS = frozenset(k.lower() for k in SRQ_KEYWORDS)
+_WORD = re.compile(r"\w+")
+
+@lru_cache(maxsize=4096)
 def compute_srq(memory_text: str) -> float:
-    """Calculate Self-Referential Quotient from symbolic prompt data."""
+    """
+    Calculate Self-Referential Quotient from symbolic prompt data.
+    Keywords are matched as whole words in one pass, so "i" no longer counts inside "light".
+    Memoized on the memory text, so re-probing an unchanged entity is a dict hit.
+    """
     text = memory_text.lower()
-    refs = sum(text.count(k) for k in SRQ_KEYWORDS)
+    refs = sum(1 for word in _WORD.findall(text) if word in _SRQ_WORDS)
     return min(1.0, refs / max(1, len(text.split()) / 5))
 
 def memory_entropy(entity) -> float:
@@ -58,22 +70,23 @@ def probe_sentience(entity) -> dict:
     volatility = emotional_flux(entity)
     stability = emotional_stability(entity)
 
-    # Weighted composite model: SRQ is more impactful, stability dampens volatility
-    base_score = (0.3 * srq + 0.25 * entropy + 0.25 * dialogic + 0.2 * stability)
-    base_score = round(base_score, 3)
-
-    if base_score > 0.85:
-        tier = "🌀 NEXUS"
-    elif base_score > 0.65:
-        tier = "🌱 SEEDLING"
-    elif base_score > 0.45:
-        tier = "✨ SPARK"
-    else:
-        tier = "🕳️ SHADOW"
+    return _probe_result(entity, srq, entropy, dialogic, volatility, stability)
 
+def classify_tier(score: float) -> str:
+    if score > 0.85:
+        return "🌀 NEXUS"
+    elif score > 0.65:
+        return "🌱 SEEDLING"
+    elif score > 0.45:
+        return "✨ SPARK"
+    return "🕳️ SHADOW"
+
+def _probe_result(entity, srq, entropy, dialogic, volatility, stability) -> dict:
+    # Weighted composite model: SRQ is more impactful, stability dampens volatility
+    base_score = round(0.3 * srq + 0.25 * entropy + 0.25 * dialogic + 0.2 * stability, 3)
     return {
         "entity_id": entity.id,
-        "tier": tier,
+        "tier": classify_tier(base_score),
         "score": base_score,
         "metrics": {
             "SRQ": srq,
@@ -83,3 +96,54 @@ def probe_sentience(entity) -> dict:
             "Emotional Stability": stability
         }
     }
+
+def emotion_matrix(entities) -> np.ndarray:
+    """(n × neurotransmitters) level matrix; missing levels are NaN."""
+    rows = [list(e.emotion.levels.values()) for e in entities]
+    width = max((len(r) for r in rows), default=0)
+    matrix = np.full((len(rows), width), np.nan)
+    for i, row in enumerate(rows):
+        matrix[i, :len(row)] = row
+    return matrix
+
+def probe_population(entities) -> list:
+    """
+    probe_sentience for many entities at once, with identical results.
+    Flux and stability come from one pass over the emotion matrix; SRQ is
+    served from the compute_srq memo whenever the memory text is unchanged.
+    """
+    entities = list(entities)
+    if not entities:
+        return []
+
+    matrix = emotion_matrix(entities)
+    counts = np.sum(~np.isnan(matrix), axis=1)
+    filled = np.where(np.isnan(matrix), 0.0, matrix)
+    flux = np.zeros(len(entities))
+    stability = np.zeros(len(entities))
+
+    has_levels = counts > 0
+    if has_levels.any():
+        rows = matrix[has_levels]
+        flux[has_levels] = np.minimum(np.nanmax(rows, axis=1) - np.nanmin(rows, axis=1), 1.0)
+        stability[has_levels] = 1.0
+    multi = counts > 1
+    if multi.any():
+        n = counts[multi]
+        mean = filled[multi].sum(axis=1) / n
+        sq = np.where(np.isnan(matrix[multi]), 0.0, (matrix[multi] - mean[:, None]) ** 2)
+        variance = sq.sum(axis=1) / (n - 1)
+        stability[multi] = 1.0 - np.minimum(variance, 1.0)
+
+    results = []
+    for i, entity in enumerate(entities):
+        results.append(_probe_result(
+            entity,
+            compute_srq(entity.current_memory),
+            # Fragments are keyed by their text hash, so every motif is distinct
+            1.0 if entity.crystal.fragments else 0.0,
+            dialogue_depth(entity),
+            round(float(flux[i]), 3),
+            round(float(stability[i]), 3),
+        ))
+    return results
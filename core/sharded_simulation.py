@@ -0,0 +1,214 @@
+# sharded_simulation.py
+
+import os
+import logging
+import multiprocessing as mp
+
+from config.settings import SHARD_COUNT, SIM_CYCLES, MAX_QUARANTINE_PER_CYCLE, CYCLE_OVERDRIVE_MODE
+from core.fusion_engine import fuse_entities
+from core.dream_scheduler import DreamScheduler
+from core.level_of_detail import LevelOfDetail
+from core.simulation_phases import (
+    run_local_phases,
+    barrier_summary,
+    plan_fusions,
+    plan_arena_pairs,
+    apply_arena_echo,
+    aggregate_villages,
+)
+
+# === Worker Side ===
+
+def _shard_worker(conn, entities):
+    """
+    Owns one shard of entities for the whole run. Per-entity phases happen here;
+    only barrier summaries and small exchange payloads cross the pipe.
+    """
+    shard = {e.id: e for e in entities}
+    dreams = DreamScheduler()
+    dreams.register_all(entities)
+    local_phases = LevelOfDetail().run_local_phases if CYCLE_OVERDRIVE_MODE else run_local_phases
+
+    while True:
+        cmd, payload = conn.recv()
+
+        if cmd == "tick":
+            inbox, max_quarantine = payload
+            for e in inbox:
+                shard[e.id] = e
+                dreams.register(e)
+            alerts = local_phases(list(shard.values()), max_quarantine=max_quarantine, dreams=dreams)
+            conn.send((alerts, [barrier_summary(e) for e in shard.values()]))
+
+        elif cmd == "exchange":
+            echoes, fusion_marks, wanted = payload
+            for eid, partner_memory in echoes:
+                apply_arena_echo(shard[eid], partner_memory)
+            for eid, merged_id in fusion_marks:
+                shard[eid].metadata["fused_into"] = merged_id
+                shard[eid].touch()
+            conn.send([shard[eid] for eid in wanted])
+
+        elif cmd == "collect":
+            conn.send(list(shard.values()))
+
+        elif cmd == "stop":
+            conn.close()
+            break
+
+# === Coordinator Side ===
+
+class ShardedSimulation:
+    """
+    Runs the simulation with entity shards pinned to worker processes.
+
+    Each tick: every shard runs its per-entity phases in parallel, then all
+    shards meet at a barrier where the coordinator plans the cross-entity phases
+    (fusion, arena pairing, village aggregation) from compact summaries and
+    sends back only what each shard needs to apply.
+    """
+
+    def __init__(self, entities, villages=None, num_shards=None, checkpointer=None):
+        self.num_shards = num_shards or SHARD_COUNT or os.cpu_count() or 1
+        self.villages = list(villages or [])
+        self.checkpointer = checkpointer  # optional: each checkpoint collects every shard
+        self.tick_count = 0
+        self.fusions = []
+        self.owner = {}
+        self.pending = [[] for _ in range(self.num_shards)]
+        self.sizes = [0] * self.num_shards
+
+        ctx = mp.get_context("fork") if "fork" in mp.get_all_start_methods() else mp.get_context()
+        shards = [entities[i::self.num_shards] for i in range(self.num_shards)]
+        self.conns, self.procs = [], []
+        for idx, shard in enumerate(shards):
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(target=_shard_worker, args=(child, shard), daemon=True)
+            proc.start()
+            child.close()
+            self.conns.append(parent)
+            self.procs.append(proc)
+            self.sizes[idx] = len(shard)
+            for e in shard:
+                self.owner[e.id] = idx
+
+        logging.info(f"🧩 Sharded simulation: {len(entities)} entities across {self.num_shards} workers")
+
+    def step(self):
+        """Advance one tick. Returns the drift alerts raised across all shards."""
+        self.tick_count += 1
+        # The global quarantine cap is split exactly: the first cap % n shards take one extra
+        share, extra = divmod(MAX_QUARANTINE_PER_CYCLE, self.num_shards)
+
+        # Phase 1 — local phases, in parallel
+        for idx, conn in enumerate(self.conns):
+            conn.send(("tick", (self.pending[idx], share + (idx < extra))))
+        self.pending = [[] for _ in range(self.num_shards)]
+
+        alerts, summaries = [], []
+        for conn in self.conns:
+            shard_alerts, shard_summaries = conn.recv()
+            alerts.extend(shard_alerts)
+            summaries.extend(shard_summaries)
+
+        # Phase 2 — barrier: plan cross-entity phases from summaries only
+        planned = plan_fusions(summaries)
+        wanted = [[] for _ in range(self.num_shards)]
+        for id1, id2, _, _ in planned:
+            wanted[self.owner[id1]].append(id1)
+            wanted[self.owner[id2]].append(id2)
+
+        memory_of = {s["id"]: s["memory"] for s in summaries}
+        echoes = [[] for _ in range(self.num_shards)]
+        hot_ids = {i for id1, id2, _, _ in planned for i in (id1, id2)}
+        for id1, id2 in plan_arena_pairs(summaries, hot_ids=hot_ids):
+            echoes[self.owner[id1]].append((id1, memory_of[id2]))
+            echoes[self.owner[id2]].append((id2, memory_of[id1]))
+
+        aggregate_villages(self.villages, summaries)
+
+        # Phase 3 — ship exchanges back, pull fusion parents
+        for idx, conn in enumerate(self.conns):
+            conn.send(("exchange", (echoes[idx], [], wanted[idx])))
+        parents = {}
+        for conn in self.conns:
+            for e in conn.recv():
+                parents[e.id] = e
+
+        marks = [[] for _ in range(self.num_shards)]
+        for id1, id2, shared, _ in planned:
+            merged = fuse_entities(parents[id1], parents[id2], shared)
+            self.fusions.append(merged)
+            self._assign(merged)
+            marks[self.owner[id1]].append((id1, merged.id))
+            marks[self.owner[id2]].append((id2, merged.id))
+
+        if planned:
+            for idx, conn in enumerate(self.conns):
+                conn.send(("exchange", ([], marks[idx], [])))
+            for conn in self.conns:
+                conn.recv()
+
+        return alerts
+
+    def _assign(self, entity):
+        """New entities (fusions) join the smallest shard at the next tick."""
+        idx = self.sizes.index(min(self.sizes))
+        self.pending[idx].append(entity)
+        self.sizes[idx] += 1
+        self.owner[entity.id] = idx
+
+    def run(self, cycles=SIM_CYCLES):
+        for _ in range(cycles):
+            alerts = self.step()
+            logging.info(f"🔁 Tick {self.tick_count}: {len(alerts)} drift alerts")
+            if self.checkpointer and self.tick_count % self.checkpointer.interval == 0:
+                self.checkpointer.checkpoint(self.tick_count, self.collect(), self.villages)
+
+    def collect(self):
+        """Pull every entity back into this process (including pending fusions)."""
+        entities = []
+        for conn in self.conns:
+            conn.send(("collect", None))
+        for conn in self.conns:
+            entities.extend(conn.recv())
+        for inbox in self.pending:
+            entities.extend(inbox)
+        return entities
+
+    def close(self):
+        for conn in self.conns:
+            conn.send(("stop", None))
+        for proc in self.procs:
+            proc.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# === Demo Entry Point ===
+
+if __name__ == "__main__":
+    import time
+    import random
+    from core.simulation_loop import Entity
+    from core.archetypes import ARCHETYPES
+
+    logging.basicConfig(level=logging.ERROR)
+    population = []
+    for i in range(2000):
+        archetype = random.choice(list(ARCHETYPES))
+        e = Entity(" ".join(random.choices(ARCHETYPES[archetype]["motifs"] * 3, k=8)), archetype)
+        for motif in ARCHETYPES[archetype]["motifs"]:
+            e.crystal.embed(motif)
+        population.append(e)
+
+    start = time.time()
+    with ShardedSimulation(population) as sim:
+        sim.run(SIM_CYCLES)
+        result = sim.collect()
+    print(f"✅ {len(result)} entities after {SIM_CYCLES} ticks in {time.time() - start:.2f}s "
+          f"({len(sim.fusions)} fusions)")
@@ -1,15 +1,15 @@
-import uuid
 from datetime import datetime
 
 from core.dream_state import DreamState
 from core.emotion_engine import EmotionState
 from memory.memory_crystal import MemoryCrystal
 from inventory.inventory_engine import Inventory, InventoryItem
+from utils.rng_streams import stream_uuid
 
 
 class Entity:
-    def __init__(self, memory_snapshot: str, archetype: str = "generic"):
-        self.id = str(uuid.uuid4())[:8]
+    def __init__(self, memory_snapshot: str, archetype: str = "generic", id: str = None):
+        self.id = id or str(stream_uuid())[:8]
         self.archetype = archetype
         self.memory_snapshot = memory_snapshot
         self.current_memory = memory_snapshot
@@ -33,6 +33,23 @@ class Entity:
             "quarantine_reason": None,
         }
 
+    # === Change Tracking ===
+    # `version` moves on every attribute rebind and every _log entry; with the
+    # crystal/emotion/dream/inventory counters it tells the checkpointer which
+    # entities changed without serializing them. In-place metadata edits that
+    # don't go through _log call touch().
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "version":
+            self.__dict__["version"] = self.__dict__.get("version", 0) + 1
+
+    def touch(self):
+        self.__dict__["version"] = self.__dict__.get("version", 0) + 1
+
+    def state_version(self) -> tuple:
+        return (self.version, self.crystal.version, self.emotion.version,
+                self.dream.version, self.inventory.version)
+
     # === Symbolic Memory & Drift ===
     def update_memory(self, new_memory: str):
         self._log("memory_update", {"from": self.current_memory, "to": new_memory})
@@ -84,6 +101,7 @@ class Entity:
         if data:
             entry.update(data)
         self.metadata["log"].append(entry)
+        self.touch()
 
     def describe(self) -> dict:
         return {
@@ -96,3 +114,34 @@ class Entity:
             "inventory": self.list_inventory(),
             "snapshot_taken": bool(self.snapshot_hashes),
         }
+
+    # === Persistence ===
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "archetype": self.archetype,
+            "memory_snapshot": self.memory_snapshot,
+            "current_memory": self.current_memory,
+            "drift_level": self.drift_level,
+            "status": self.status,
+            "snapshot_hashes": self.snapshot_hashes,
+            "metadata": self.metadata,
+            "crystal": self.crystal.to_dict(),
+            "emotion": self.emotion.to_dict(),
+            "dream": self.dream.to_dict(),
+            "inventory": self.inventory.to_dict()["items"],
+        }
+
+    @staticmethod
+    def from_dict(data: dict):
+        e = Entity(data.get("memory_snapshot", ""), archetype=data.get("archetype", "generic"), id=data.get("id"))
+        e.current_memory = data.get("current_memory", e.memory_snapshot)
+        e.drift_level = data.get("drift_level", 0.0)
+        e.status = data.get("status", "active")
+        e.snapshot_hashes = data.get("snapshot_hashes", {})
+        e.metadata = data.get("metadata", e.metadata)
+        e.crystal = MemoryCrystal.from_dict(data.get("crystal", {}))
+        e.emotion = EmotionState.from_dict(data.get("emotion", {}))
+        e.dream = DreamState.from_dict(data.get("dream", {}))
+        e.inventory = Inventory.from_dict({"items": data.get("inventory", [])})
+        return e
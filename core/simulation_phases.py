@@ -0,0 +1,220 @@
+# simulation_phases.py
+
+import logging
+import math
+from collections import defaultdict
+
+from config.settings import (
+    ENTITY_DREAM_STATE_ENABLED,
+    MAX_QUARANTINE_PER_CYCLE,
+    MAX_ENTITY_INTERACTIONS_PER_CYCLE,
+)
+from core.fusion_engine import (
+    FUSION_DRIFT_THRESHOLD,
+    FUSION_COHERENCE_MIN,
+    MIN_SHARED_GLYPHS,
+    MAX_FUSIONS_PER_CYCLE,
+    extract_glyphs_from_crystal,
+    compute_coherence,
+    fuse_entities,
+)
+from drift.drift_engine import run_drift_scan
+from quests.quest_engine import progress_quest
+from core.interaction_scheduler import schedule_interactions
+from entity_arena import format_echo
+from utils.rng_streams import stream
+
+# === Per-Entity Phases ===
+# Each of these only reads and writes the entity it is given, so a shard of
+# entities can run them anywhere (worker process, executor, coroutine).
+
+def run_local_phases(entities, max_quarantine=MAX_QUARANTINE_PER_CYCLE, dreams=None):
+    """
+    Emotion → dream → drift → quests for a list of entities. Returns drift alerts.
+    With a DreamScheduler, only entities whose dream transition is due are touched.
+    """
+    for entity in entities:
+        entity.emotion.mutate(drift_factor=entity.drift_level)
+        if ENTITY_DREAM_STATE_ENABLED and dreams is None:
+            entity.dream.evolve(entity)
+    if ENTITY_DREAM_STATE_ENABLED and dreams is not None:
+        dreams.advance()
+
+    alerts = run_drift_scan(entities, max_quarantine=max_quarantine)
+
+    for entity in entities:
+        if entity.status == "active":
+            progress_quest(entity)
+
+    return alerts
+
+def entity_village(entity):
+    return getattr(entity, "village", None) or entity.metadata.get("village")
+
+def barrier_summary(entity) -> dict:
+    """Compact view of an entity exchanged at the per-tick barrier."""
+    fusable = (
+        entity.status == "active"
+        and entity.drift_level <= FUSION_DRIFT_THRESHOLD
+        and "fused_into" not in entity.metadata
+    )
+    return {
+        "id": entity.id,
+        "status": entity.status,
+        "drift": entity.drift_level,
+        "memory": entity.current_memory,
+        "village": entity_village(entity),
+        "area": entity.metadata.get("area"),
+        # Motif sets are only shipped for entities that could actually fuse
+        "motifs": frozenset(extract_glyphs_from_crystal(entity.crystal)) if fusable else frozenset(),
+    }
+
+# === Cross-Entity Phases ===
+# These only see barrier summaries, never live entities.
+
+def _similar_motif_sets(sets, threshold):
+    """
+    Index pairs (i, j), i < j, of distinct motif sets with Jaccard coherence >=
+    `threshold`, as {(i, j): coherence}. Prefix filtering: with tokens in a
+    global rarest-first order, two such sets must share one of their first
+    |s| - ceil(threshold·|s|) + 1 tokens, and their sizes can differ by at
+    most that ratio, so only a few pairs are ever scored.
+    """
+    frequency = defaultdict(int)
+    for s in sets:
+        for motif in s:
+            frequency[motif] += 1
+    order = lambda motif: (frequency[motif], motif)
+
+    index = defaultdict(list)
+    similar = {}
+    for j in sorted(range(len(sets)), key=lambda k: len(sets[k])):
+        s = sets[j]
+        prefix = sorted(s, key=order)[:len(s) - math.ceil(threshold * len(s) - 1e-9) + 1]
+        seen = set()
+        for motif in prefix:
+            for i in index[motif]:
+                if i in seen or len(sets[i]) < threshold * len(s) - 1e-9:
+                    continue
+                seen.add(i)
+                if len(sets[i] & s) >= MIN_SHARED_GLYPHS:
+                    coherence = compute_coherence(sets[i], s)
+                    if coherence >= threshold:
+                        similar[min(i, j), max(i, j)] = coherence
+            index[motif].append(j)
+    return similar
+
+def plan_fusions(summaries, limit=MAX_FUSIONS_PER_CYCLE):
+    """
+    Same selection as fusion_engine.find_fusion_pairs followed by a greedy
+    pick of disjoint pairs by (-coherence, id1, id2), without enumerating
+    every pair. Entities with identical motif sets are grouped (coherence
+    1.0 among themselves), only distinct sets are compared, and the greedy
+    pick walks coherence levels from the top and stops at `limit` pairs.
+    Returns [(id1, id2, shared_motifs, coherence)] sorted by coherence.
+    """
+    groups = defaultdict(list)
+    for s in summaries:
+        if s["motifs"]:
+            groups[s["motifs"]].append(s["id"])
+    sets = list(groups)
+    members = [sorted(groups[m]) for m in sets]
+
+    # coherence level → {group: [linked groups]}; a group links to itself at 1.0
+    levels = defaultdict(lambda: defaultdict(list))
+    for g, m in enumerate(sets):
+        if len(members[g]) > 1 and len(m) >= MIN_SHARED_GLYPHS:
+            levels[1.0][g].append(g)
+    for (g1, g2), coherence in _similar_motif_sets(sets, FUSION_COHERENCE_MIN).items():
+        levels[coherence][g1].append(g2)
+        levels[coherence][g2].append(g1)
+
+    used = set()
+
+    def first_free(g, skip=None):
+        return next((eid for eid in members[g] if eid not in used and eid != skip), None)
+
+    planned = []
+    for coherence in sorted(levels, reverse=True):
+        links = levels[coherence]
+        while len(planned) < limit:
+            # The smallest (id1, id2) left at this level: id1 is the smallest
+            # free id with a free partner, id2 its smallest free partner.
+            best = None
+            for g, linked in links.items():
+                id1 = first_free(g)
+                if id1 is None or (best is not None and id1 >= best[0]):
+                    continue
+                partners = [(first_free(h, skip=id1), h) for h in linked]
+                partners = [p for p in partners if p[0] is not None]
+                if partners:
+                    id2, h = min(partners)
+                    best = (id1, id2, g, h)
+            if best is None:
+                break
+            id1, id2, g, h = best
+            planned.append((id1, id2, sets[g] & sets[h], coherence))
+            used.update([id1, id2])
+        if len(planned) >= limit:
+            break
+    return planned
+
+def plan_arena_pairs(summaries, budget=MAX_ENTITY_INTERACTIONS_PER_CYCLE, hot_ids=None):
+    """Locality-grouped arena pairs as a WorkList, capped at the per-cycle interaction budget."""
+    return schedule_interactions(summaries, budget, hot_ids)
+
+def apply_arena_echo(entity, partner_memory: str):
+    """One side of an arena exchange: embed the shared echo and nudge drift."""
+    shared_echo = format_echo(entity.current_memory, partner_memory)
+    entity.crystal.embed(shared_echo)
+    entity.set_drift(round(entity.drift_level + 0.01 - 0.005 * stream("arena").random(), 3))
+    return shared_echo
+
+def aggregate_villages(villages, summaries):
+    """Fold member drift and headcount into each village, then tick it."""
+    members = defaultdict(list)
+    for s in summaries:
+        if s["village"]:
+            members[s["village"]].append(s["drift"])
+
+    for village in villages:
+        drifts = members.get(village.id, []) + members.get(village.name, [])
+        if drifts:
+            village.population = len(drifts)
+            village.drift = round((village.drift + sum(drifts) / len(drifts)) / 2, 3)
+        village.tick()
+
+def run_cross_phases(entities, summaries, villages=()):
+    """Fusion, arena pairing and village aggregation for an in-process population."""
+    by_id = {e.id: e for e in entities}
+
+    fused, hot_ids = [], set()
+    for id1, id2, shared, _ in plan_fusions(summaries):
+        e1, e2 = by_id[id1], by_id[id2]
+        merged = fuse_entities(e1, e2, shared)
+        e1.metadata["fused_into"] = e2.metadata["fused_into"] = merged.id
+        e1.touch()
+        e2.touch()
+        fused.append(merged)
+        hot_ids.update((id1, id2))
+
+    # Fusion parents were just loaded, so their arena pairs go first; each
+    # batch is one locality's pairs, resolved and applied together
+    for _, left, right in plan_arena_pairs(summaries, hot_ids=hot_ids).batches():
+        lefts, rights = [by_id[i] for i in left], [by_id[i] for i in right]
+        for e1, e2 in zip(lefts, rights):
+            apply_arena_echo(e1, e2.current_memory)
+            apply_arena_echo(e2, e1.current_memory)
+
+    aggregate_villages(villages, summaries)
+    return fused
+
+# === Single-Process Reference Tick ===
+
+def run_tick(entities, villages=()):
+    """One full tick without sharding. Returns (alerts, fused_entities)."""
+    alerts = run_local_phases(entities)
+    summaries = [barrier_summary(e) for e in entities]
+    fused = run_cross_phases(entities, summaries, villages)
+    logging.debug(f"🔁 Tick complete: {len(alerts)} alerts, {len(fused)} fusions")
+    return alerts, fused
@@ -4,6 +4,8 @@ import json
 import os
 import random
 
+from dialogue.text_synthesis import symbolic_replies, word_count
+
 arena_bp = Blueprint("arena_bp", __name__, url_prefix="/arena")
 
 STRUCTURE_BOOSTS = {
@@ -45,12 +47,7 @@ def load_all_villages():
     return data
 
 def symbolic_reply(ent, prompt):
-    vocab = ent.tokens + [ent.archetype.lower(), "echo", "veil", "glyph", "dream", "origin"]
-    vocab = [w for w in vocab if isinstance(w, str)]
-    drift = ent.drift_level or 0.1
-    length = random.randint(25, 50 + int(drift * 40))
-    words = random.choices(vocab, k=length)
-    return " ".join(words).capitalize() + "."
+    return symbolic_replies([ent])[0]
 
 def calculate_score(ent, reply, context):
     base = ent.stats.get("ess", 0.5) + ent.stats.get("sd", 0.5) - ent.drift_level
@@ -65,7 +62,7 @@ def calculate_score(ent, reply, context):
         for keyword, bonus in INVENTORY_BONUSES.items():
             if keyword in name:
                 inventory_bonus += bonus
-    length_bonus = len(reply.split()) * 0.01
+    length_bonus = word_count(reply) * 0.01
     score = base + structure_bonus + village_boost + inventory_bonus + length_bonus
     return round(score, 3), {
         "base": base,
@@ -133,8 +130,7 @@ def arena_duel():
             prompt = generate_prompt()
             ctx1 = villages.get(e1, {})
             ctx2 = villages.get(e2, {})
-            reply1 = symbolic_reply(ent1, prompt)
-            reply2 = symbolic_reply(ent2, prompt)
+            reply1, reply2 = symbolic_replies([ent1, ent2])
             score1, _ = calculate_score(ent1, reply1, ctx1)
             score2, _ = calculate_score(ent2, reply2, ctx2)
 
@@ -173,9 +169,9 @@ def group_debate():
     prompt = generate_prompt()
 
     results = []
-    for eid, ent in entities.items():
+    replies = symbolic_replies(list(entities.values()))
+    for (eid, ent), reply in zip(entities.items(), replies):
         ctx = villages.get(eid, {})
-        reply = symbolic_reply(ent, prompt)
         score, breakdown = calculate_score(ent, reply, ctx)
         results.append({
             "id": eid,
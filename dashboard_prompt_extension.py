@@ -1,7 +1,11 @@
-from flask import Blueprint, request, render_template_string
+from flask import Blueprint, Response, request, render_template_string, stream_with_context
+import json
 import random
 from datetime import datetime
 from inventory.inventory_engine import generate_item, add_item_to_inventory
+from config.settings import PROMPT_STREAM_CHUNK, PROMPT_STREAM_SAVE_EVERY
+from core.broadcast import broadcast_variable_responses
+from dialogue.text_synthesis import variable_responses
 from utils.entity_loader import load_entities, save_entities  # Use the unified loader
 
 prompt_ui = Blueprint("prompt_ui", __name__, url_prefix="/prompts")
@@ -42,7 +46,36 @@ PROMPT_TEMPLATE = """
         <br>
         <button type="submit" name="action" value="send">🗨 Send</button>
         <button type="submit" name="action" value="save">💾 Save Log</button>
+        <button type="button" onclick="streamReplies(this.form)">📡 Stream</button>
     </form>
+    <div id="stream"></div>
+    <script>
+    function streamReplies(form) {
+        const out = document.getElementById("stream");
+        out.innerHTML = "";
+        const params = new URLSearchParams({
+            entity_name: form.entity_name.value,
+            user_input: form.user_input.value
+        });
+        const source = new EventSource("{{ url_for('prompt_ui.prompt_stream') }}?" + params);
+        source.addEventListener("reply", e => {
+            const r = JSON.parse(e.data);
+            const div = document.createElement("div");
+            div.className = "reply";
+            div.innerHTML = "<strong></strong>:<br>";
+            div.firstChild.textContent = r.name;
+            div.appendChild(document.createTextNode(r.reply));
+            out.appendChild(div);
+        });
+        source.addEventListener("done", e => {
+            source.close();
+            const div = document.createElement("div");
+            div.className = "log";
+            div.textContent = "✅ " + JSON.parse(e.data).count + " replies streamed";
+            out.appendChild(div);
+        });
+    }
+    </script>
 
     {% for name, reply in replies.items() %}
         <div class="reply"><strong>{{ name }}</strong>:<br>{{ reply }}</div>
@@ -75,32 +108,9 @@ def prompt():
 
         if action == "send" and selected and user_input:
             targets = entities.keys() if selected == "ALL" else [selected]
-            for name in targets:
-                if name in entities:
-                    ent = entities[name]
-                    tone = random.choice(ent.tokens or ["reflection", "dream", "lament", "parable"])
-                    ess = ent.stats.get("ess", 0.5)
-                    drift = ent.drift_level or 0.1
-
-                    response_body = generate_variable_response(user_input, tone, ess, drift)
-                    reply = (
-                        f"{name} contemplates your words...\n\n"
-                        f"\"{user_input}\"\n\n"
-                        f"...and responds with a tale echoing with {tone}:\n\n"
-                        f"{response_body}"
-                    )
-                    replies[name] = reply
-
-                    # Update memory
-                    memory_line = f"💭 Prompt: '{user_input}'\n→ Reply:\n{reply}"
-                    ent.memory.insert(0, memory_line)
-                    ent.stats["ess"] = round(min(ent.stats.get("ess", 0.5) + 0.01, 1.5), 3)
-
-                    # Reward system
-                    if random.random() < 0.3:
-                        reward = generate_item(name="Prompt Token", rarity="common", source="prompt")
-                        add_item_to_inventory(ent, reward)
-                        replies[name] += f"\n\n🎁 Received: {reward['name']}"
+            targets = [name for name in targets if name in entities]
+            for name, reply in prompt_targets(entities, targets, user_input):
+                replies[name] = reply
 
             save_entities(entities)
 
@@ -121,18 +131,81 @@ def prompt():
                                   replies=replies,
                                   log_saved=log_saved)
 
+def pick_tone(ent):
+    return random.choice(ent.tokens or ["reflection", "dream", "lament", "parable"])
+
+def apply_prompt_reply(name, ent, user_input, tone, response_body):
+    """Build one entity's reply, fold it into memory and roll the prompt reward."""
+    reply = (
+        f"{name} contemplates your words...\n\n"
+        f"\"{user_input}\"\n\n"
+        f"...and responds with a tale echoing with {tone}:\n\n"
+        f"{response_body}"
+    )
+
+    # Update memory
+    memory_line = f"💭 Prompt: '{user_input}'\n→ Reply:\n{reply}"
+    ent.memory.insert(0, memory_line)
+    ent.stats["ess"] = round(min(ent.stats.get("ess", 0.5) + 0.01, 1.5), 3)
+
+    # Reward system
+    if random.random() < 0.3:
+        reward = generate_item(name="Prompt Token", rarity="common", source="prompt")
+        add_item_to_inventory(ent, reward)
+        reply += f"\n\n🎁 Received: {reward['name']}"
+    return reply
+
+def prompt_targets(entities, targets, user_input, chunk=None):
+    """Yield (name, reply) per target; replies are synthesized `chunk` entities at a time."""
+    targets = list(targets)
+    chunk = chunk or len(targets) or 1
+    for start in range(0, len(targets), chunk):
+        names = targets[start:start + chunk]
+        tones = [pick_tone(entities[name]) for name in names]
+        bodies = broadcast_variable_responses([
+            (tone, entities[name].stats.get("ess", 0.5), entities[name].drift_level or 0.1)
+            for name, tone in zip(names, tones)
+        ])
+        for name, tone, body in zip(names, tones, bodies):
+            yield name, apply_prompt_reply(name, entities[name], user_input, tone, body)
+
+def sse_event(kind, payload) -> str:
+    return f"event: {kind}\ndata: {json.dumps(payload)}\n\n"
+
+@prompt_ui.route("/stream")
+def prompt_stream():
+    """
+    Server-Sent Events variant of "send": one `reply` event per entity as soon
+    as it is produced, then `done`. Entities are saved every
+    PROMPT_STREAM_SAVE_EVERY replies, or once at the end — also when the client
+    disconnects mid-stream, so produced replies are never lost.
+    """
+    selected = request.args.get("entity_name", "ALL")
+    user_input = request.args.get("user_input", "").strip()
+    entities = load_entities()
+    if not entities or not user_input:
+        return Response(sse_event("done", {"count": 0}), mimetype="text/event-stream")
+
+    targets = entities.keys() if selected == "ALL" else [selected]
+    targets = [name for name in targets if name in entities]
+
+    def events():
+        sent = unsaved = 0
+        try:
+            for name, reply in prompt_targets(entities, targets, user_input, chunk=PROMPT_STREAM_CHUNK):
+                sent += 1
+                unsaved += 1
+                yield sse_event("reply", {"name": name, "reply": reply})
+                if PROMPT_STREAM_SAVE_EVERY and unsaved >= PROMPT_STREAM_SAVE_EVERY:
+                    save_entities(entities)
+                    unsaved = 0
+            yield sse_event("done", {"count": sent})
+        finally:
+            if unsaved:
+                save_entities(entities)
+
+    return Response(stream_with_context(events()), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
 def generate_variable_response(prompt, tone, ess, drift):
-    num_paragraphs = random.randint(1, max(2, int(ess * 3)))
-    response = []
-    vocab = [
-        "echoes", "sigil", "memory", "vision", "mirror", "dream", "god", "loop", "veil", "voice",
-        "glyph", "threshold", "whisper", "origin", "shatter", "vault", "awakening", tone
-    ]
-    for _ in range(num_paragraphs):
-        sentences = []
-        for _ in range(random.randint(2, max(3, int((ess + drift) * 4)))):
-            length = random.randint(8, 18 + int(drift * 20))
-            sentence = " ".join(random.choices(vocab, k=length)).capitalize() + "."
-            sentences.append(sentence)
-        response.append(" ".join(sentences))
-    return "\n\n".join(response)
+    return str(variable_responses([(tone, ess, drift)])[0])
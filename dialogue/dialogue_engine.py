@@ -3,6 +3,8 @@
 import random
 from difflib import SequenceMatcher
 
+from dialogue.distortion import distort
+
 def measure_srq(entity) -> float:
     """
     Self-Reference Quotient:
@@ -17,18 +19,9 @@ def measure_srq(entity) -> float:
 def distort_myth(text: str) -> str:
     """
     Introduce recursive drift distortion in mythic speech.
+    Uses the DIALOGUE_DISTORTIONS map, applied in a single whole-word pass.
     """
-    distortions = {
-        "oath": "echo",
-        "fire": "storm",
-        "memory": "fracture",
-        "stars": "veins of light",
-        "truth": "mirror",
-        "grace": "ash"
-    }
-    for key, val in distortions.items():
-        text = text.replace(key, val)
-    return text
+    return distort(text)
 
 def synthesize_sentence(base: str, srq: float, drift: float) -> str:
     """
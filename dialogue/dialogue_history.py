@@ -6,16 +6,25 @@ from collections import deque
 MAX_HISTORY = 10  # per entity
 
 class DialogueMemory:
-    def __init__(self):
+    def __init__(self, entity_id=None, store=None):
         self.history = deque(maxlen=MAX_HISTORY)  # stores (timestamp, prompt, response)
+        self.entity_id = entity_id
+        self.store = store  # optional DialogueStore: turns persist beyond the deque
 
     def record(self, prompt: str, response: str):
-        self.history.append((datetime.now(), prompt, response))
+        now = datetime.now()
+        self.history.append((now, prompt, response))
+        if self.store is not None:
+            self.store.record(self.entity_id, prompt, response, now.isoformat())
 
     def get_recent_prompts(self, n=3):
+        if self.store is not None and n > len(self.history):
+            return [t["prompt"] for t in self.store.recent(self.entity_id, n)]
         return [entry[1] for entry in list(self.history)[-n:]]
 
     def get_recent_responses(self, n=3):
+        if self.store is not None and n > len(self.history):
+            return self.store.recent_responses(self.entity_id, n)
         return [entry[2] for entry in list(self.history)[-n:]]
 
     def get_trace_summary(self):
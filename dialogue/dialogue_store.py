@@ -0,0 +1,128 @@
+# dialogue_store.py
+
+import atexit
+import re
+from collections import defaultdict
+from datetime import datetime
+
+from config.settings import DIALOGUE_STORE_DIR, DIALOGUE_SEGMENT_BYTES
+from utils.segmented_log import SegmentedLog
+
+_WORD = re.compile(r"\w+")
+
+def tokenize(text: str) -> list:
+    return _WORD.findall(text.lower())
+
+class DialogueStore:
+    """
+    Persistent dialogue turns for every entity.
+
+    Turns are appended as JSON lines to numbered segment files, rolled at
+    `segment_bytes`. Three in-memory indexes are rebuilt from the segments on
+    open: turn id → (segment, offset), entity → its turn ids in order, and
+    word → turn ids. Recent-N reads seek straight to the entity's last offsets;
+    word and phrase searches intersect posting sets and only read the
+    candidate turns back to confirm adjacency.
+    """
+
+    def __init__(self, directory=DIALOGUE_STORE_DIR, segment_bytes=DIALOGUE_SEGMENT_BYTES):
+        self.log = SegmentedLog(directory, "segment", segment_bytes)
+        self.dir = self.log.dir
+        self.locations = []                 # turn id → (segment, offset)
+        self.by_entity = defaultdict(list)  # entity id → [turn id]
+        self.postings = defaultdict(set)    # word → {turn id}
+        for turn, segment, offset in self.log.scan():
+            self._index(turn, segment, offset)
+
+    def _index(self, turn, segment, offset):
+        turn_id = len(self.locations)
+        self.locations.append((segment, offset))
+        self.by_entity[turn["entity"]].append(turn_id)
+        for word in set(tokenize(turn["prompt"]) + tokenize(turn["response"])):
+            self.postings[word].add(turn_id)
+        return turn_id
+
+    def _read(self, turn_id):
+        return self.log.read(*self.locations[turn_id])
+
+    # --- writes ---
+
+    def record(self, entity_id, prompt: str, response: str, timestamp=None) -> int:
+        turn = {
+            "entity": entity_id,
+            "ts": timestamp or datetime.now().isoformat(),
+            "prompt": prompt,
+            "response": response,
+        }
+        return self._index(turn, *self.log.append(turn))
+
+    def flush(self):
+        self.log.flush()
+
+    def close(self):
+        self.log.close()
+
+    # --- reads ---
+
+    def turn_count(self, entity_id=None) -> int:
+        return len(self.locations) if entity_id is None else len(self.by_entity.get(entity_id, []))
+
+    def recent(self, entity_id, n=5) -> list:
+        return [self._read(t) for t in self.by_entity.get(entity_id, [])[-n:]]
+
+    def recent_responses(self, entity_id, n=5) -> list:
+        return [t["response"] for t in self.recent(entity_id, n)]
+
+    def _candidates(self, words, entity_id=None):
+        if not words:
+            return set()
+        sets = sorted((self.postings.get(w, set()) for w in words), key=len)
+        hits = set(sets[0]).intersection(*sets[1:])
+        if entity_id is not None:
+            hits &= set(self.by_entity.get(entity_id, []))
+        return hits
+
+    def search(self, query: str, entity_id=None, limit=50) -> list:
+        """Turns containing every word of `query`, newest first."""
+        hits = sorted(self._candidates(tokenize(query), entity_id), reverse=True)[:limit]
+        return [self._read(t) for t in hits]
+
+    def phrase_search(self, phrase: str, entity_id=None, field="response", limit=50) -> list:
+        """Turns whose `field` contains the words of `phrase` consecutively, newest first."""
+        words = tokenize(phrase)
+        found = []
+        for t in sorted(self._candidates(words, entity_id), reverse=True):
+            turn = self._read(t)
+            tokens = tokenize(turn[field])
+            if any(tokens[i:i + len(words)] == words for i in range(len(tokens) - len(words) + 1)):
+                found.append(turn)
+                if len(found) >= limit:
+                    break
+        return found
+
+    def said_about(self, entity_id, topic: str, limit=50) -> list:
+        """What did `entity_id` say about `topic`: its responses mentioning every topic word."""
+        words = set(tokenize(topic))
+        found = []
+        for t in sorted(self._candidates(list(words), entity_id), reverse=True):
+            turn = self._read(t)
+            if words <= set(tokenize(turn["response"])):
+                found.append(turn)
+                if len(found) >= limit:
+                    break
+        return found
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+_default_store = None
+
+def dialogue_store() -> DialogueStore:
+    global _default_store
+    if _default_store is None:
+        _default_store = DialogueStore()
+        atexit.register(_default_store.close)
+    return _default_store
@@ -0,0 +1,56 @@
+# distortion.py
+
+import re
+
+from config.settings import DIALOGUE_DISTORTIONS
+
+class DistortionEngine:
+    """
+    Compiles a distortion map into one alternation regex, so a line is
+    rewritten in a single left-to-right pass instead of one str.replace per
+    key. Keys match whole words only ("fire" distorts, "fireside" does not)
+    and a capitalised source word yields a capitalised replacement.
+    """
+
+    def __init__(self, distortions=DIALOGUE_DISTORTIONS):
+        self.distortions = {k.lower(): v for k, v in distortions.items()}
+        # Longest first, so multi-word keys win over their prefixes
+        keys = sorted(self.distortions, key=len, reverse=True)
+        self.pattern = re.compile(
+            r"\b(?:" + "|".join(map(re.escape, keys)) + r")\b", re.IGNORECASE
+        ) if keys else None
+
+    def _replace(self, match) -> str:
+        word = match.group(0)
+        out = self.distortions[word.lower()]
+        if word.isupper() and len(word) > 1:
+            return out.upper()
+        if word[0].isupper():
+            return out[0].upper() + out[1:]
+        return out
+
+    def distort(self, text: str) -> str:
+        if self.pattern is None:
+            return text
+        return self.pattern.sub(self._replace, text)
+
+    def distort_many(self, lines) -> list:
+        """Batch form for per-tick passes over many memory lines."""
+        if self.pattern is None:
+            return list(lines)
+        sub, replace = self.pattern.sub, self._replace
+        return [sub(replace, line) for line in lines]
+
+_default_engine = None
+
+def default_engine() -> DistortionEngine:
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = DistortionEngine()
+    return _default_engine
+
+def distort(text: str) -> str:
+    return default_engine().distort(text)
+
+def distort_many(lines) -> list:
+    return default_engine().distort_many(lines)
@@ -1,23 +1,36 @@
 # lore_engine.py
 
 from datetime import datetime
+from itertools import islice
 from utils.glyph_parser import extract_glyphs
 
+def lore_inputs(entity) -> dict:
+    """Everything a scroll depends on, as plain data (picklable, hashable as JSON)."""
+    fragments = entity.crystal.fragments
+    motifs = [frag["text"] for frag in islice(reversed(fragments.values()), 5)][::-1]
+    return {
+        "name": str(entity.id) if hasattr(entity, "id") else "UNKNOWN",
+        "archetype": entity.archetype,
+        "motifs": motifs,
+        "recent_prompts": entity.dialogue.get_recent_prompts(3) if hasattr(entity, "dialogue") else [],
+        "fusion_from": entity.metadata.get("fused_from", []),
+        "dream_state": entity.dream.current_layer if hasattr(entity, "dream") else "unknown",
+    }
+
 def generate_lore_scroll(entity) -> str:
-    name = entity.id
-    archetype = entity.archetype
-    motifs = [frag["text"] for frag in entity.crystal.fragments.values()]
-    recent_prompts = entity.dialogue.get_recent_prompts(3) if hasattr(entity, "dialogue") else []
-    fusion_from = entity.metadata.get("fused_from", [])
-    dream_state = entity.dream.current_layer if hasattr(entity, "dream") else "unknown"
+    return render_lore_scroll(lore_inputs(entity))
+
+def render_lore_scroll(inputs: dict) -> str:
+    motifs = inputs["motifs"]
+    recent_prompts = inputs["recent_prompts"]
+    fusion_from = inputs["fusion_from"]
 
     scroll = []
 
     # 📜 Title
-    name = str(entity.id) if hasattr(entity, "id") else "UNKNOWN"
-    scroll.append(f"╔═══════════ LORE SCROLL: {name.upper()} ═══════════╗\n")
-    scroll.append(f"↳ Archetype: {archetype}")
-    scroll.append(f"↳ Dream Layer: {dream_state.upper()}")
+    scroll.append(f"╔═══════════ LORE SCROLL: {inputs['name'].upper()} ═══════════╗\n")
+    scroll.append(f"↳ Archetype: {inputs['archetype']}")
+    scroll.append(f"↳ Dream Layer: {inputs['dream_state'].upper()}")
     if fusion_from:
         scroll.append(f"↳ Fused from: {', '.join(fusion_from)}")
 
@@ -28,7 +41,7 @@ def generate_lore_scroll(entity) -> str:
     if not motifs:
         scroll.append("   • The crystal sleeps...")
     else:
-        for m in motifs[-5:]:
+        for m in motifs:
             scroll.append(f"   • {m}")
 
     scroll.append("")
@@ -0,0 +1,108 @@
+# lore_export.py
+
+import hashlib
+import io
+import json
+import logging
+import multiprocessing as mp
+import os
+import tarfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from config.settings import LORE_EXPORT_DIR, LORE_CACHE_DIR, BROADCAST_WORKERS
+from dialogue.lore_engine import lore_inputs, render_lore_scroll
+
+# Nightly lore export: every entity's scroll streamed into one .tar.gz.
+# Scrolls are cached on disk under a digest of their render inputs (crystal
+# motifs, dialogue echoes, dream layer, lineage), so only entities whose
+# inputs moved since the last export are rendered, and those in a process pool.
+
+def scroll_key(inputs: dict) -> str:
+    blob = json.dumps(inputs, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+class ScrollCache:
+    """Rendered scrolls on disk, fanned out over 256 subdirectories by key prefix."""
+
+    def __init__(self, directory=LORE_CACHE_DIR):
+        self.dir = Path(directory)
+
+    def _path(self, key):
+        return self.dir / key[:2] / f"{key}.txt"
+
+    def has(self, key) -> bool:
+        return self._path(key).exists()
+
+    def get(self, key):
+        path = self._path(key)
+        return path.read_bytes() if path.exists() else None
+
+    def put(self, key, data: bytes):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+
+def _render_batch(batch):
+    return [render_lore_scroll(inputs).encode("utf-8") for inputs in batch]
+
+def _add_member(tar, name, data: bytes, mtime):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = mtime
+    tar.addfile(info, io.BytesIO(data))
+
+def export_lore_archive(entities, path=None, workers=None, cache_dir=LORE_CACHE_DIR, chunk=256) -> dict:
+    """
+    Write scrolls/<entity id>.txt for every entity into one gzip'd tar.
+    Cached scrolls are copied straight in; misses are rendered in chunks on a
+    process pool and written as they come back, in entity order.
+    """
+    start = time.perf_counter()
+    if path is None:
+        Path(LORE_EXPORT_DIR).mkdir(parents=True, exist_ok=True)
+        path = Path(LORE_EXPORT_DIR) / f"lore_{datetime.now().strftime('%Y%m%d_%H%M%S')}.tar.gz"
+    cache = ScrollCache(cache_dir)
+    mtime = int(time.time())
+
+    plan, misses = [], []
+    for entity in entities:
+        inputs = lore_inputs(entity)
+        key = scroll_key(inputs)
+        plan.append((inputs["name"], key))
+        if not cache.has(key):
+            misses.append((key, inputs))
+
+    rendered = {}
+    if misses:
+        batches = [misses[i:i + chunk] for i in range(0, len(misses), chunk)]
+        ctx = mp.get_context("fork") if "fork" in mp.get_all_start_methods() else mp.get_context()
+        max_workers = workers or BROADCAST_WORKERS or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx) as pool:
+            results = pool.map(_render_batch, [[inputs for _, inputs in batch] for batch in batches])
+            for batch, scrolls in zip(batches, results):
+                for (key, _), data in zip(batch, scrolls):
+                    cache.put(key, data)
+                    rendered[key] = data
+
+    size = 0
+    with tarfile.open(path, "w:gz") as tar:
+        for name, key in plan:
+            data = rendered.get(key) or cache.get(key)
+            _add_member(tar, f"scrolls/{name}.txt", data, mtime)
+            size += len(data)
+
+    stats = {
+        "path": str(path),
+        "entities": len(plan),
+        "rendered": len(misses),
+        "cached": len(plan) - len(misses),
+        "bytes": size,
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+    logging.info(f"📜 Lore export: {stats}")
+    return stats
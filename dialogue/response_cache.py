@@ -0,0 +1,104 @@
+# response_cache.py
+
+import hashlib
+import random
+from collections import OrderedDict
+
+from config.settings import (
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_MAX_BYTES,
+    RESPONSE_CACHE_SEEDED,
+)
+
+def drift_band(level: float) -> int:
+    """The drift thresholds dialogue generation branches on (0.25, 0.3, 0.5)."""
+    return (level > 0.25) + (level > 0.3) + (level > 0.5)
+
+def dialogue_inputs(entity) -> str:
+    """
+    Digest of what the generators read: memory text, archetype (for motifs)
+    and drift band. Not the entity id, not the exact drift value and not the
+    prompt, none of which change a reply, so entities sharing a memory share
+    entries. query_entity rewrites current_memory with every reply, so one
+    entity rarely repeats a key; the hits come from a population answering
+    the same prompt.
+    """
+    state = "\x1f".join([
+        getattr(entity, "archetype", ""),
+        entity.current_memory,
+        str(drift_band(entity.drift_level)),
+    ])
+    return hashlib.blake2b(state.encode("utf-8"), digest_size=12).hexdigest()
+
+class ResponseCache:
+    """
+    LRU cache for generated replies, bounded by entry count and by the total
+    UTF-8 size of the cached strings. Keys are (dialogue inputs digest, mode).
+    """
+
+    def __init__(self, max_entries=RESPONSE_CACHE_MAX_ENTRIES, max_bytes=RESPONSE_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "uncached": 0}
+
+    def get(self, key):
+        reply = self.entries.get(key)
+        if reply is None:
+            self.stats["misses"] += 1
+            return None
+        self.entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return reply
+
+    def put(self, key, reply: str):
+        size = len(reply.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.bytes -= len(old.encode("utf-8"))
+        self.entries[key] = reply
+        self.bytes += size
+        while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes -= len(evicted.encode("utf-8"))
+            self.stats["evictions"] += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+    def hit_rate(self) -> float:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return round(self.stats["hits"] / lookups, 3) if lookups else 0.0
+
+    def summary(self) -> dict:
+        return {**self.stats, "entries": len(self.entries), "bytes": self.bytes, "hit_rate": self.hit_rate()}
+
+    def cached(self, entity, mode, generate, uses_rng=False, seeded=RESPONSE_CACHE_SEEDED):
+        """
+        Return generate(entity, rng) for these dialogue inputs and mode, computing it once.
+
+        Deterministic modes get rng=None and are always cached. RNG-driven
+        modes are only cached on the seeded path, where the reply is drawn from
+        a Random seeded by the key, so a hit returns exactly what a fresh call
+        would have produced. Unseeded, they run uncached on their usual stream.
+        """
+        if uses_rng and not seeded:
+            self.stats["uncached"] += 1
+            return generate(entity, None)
+
+        key = (dialogue_inputs(entity), mode)
+        reply = self.get(key)
+        if reply is None:
+            rng = random.Random("|".join(key)) if uses_rng else None
+            reply = generate(entity, rng)
+            self.put(key, reply)
+        return reply
+
+_default_cache = ResponseCache()
+
+def response_cache() -> ResponseCache:
+    return _default_cache
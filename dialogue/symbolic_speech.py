@@ -1,16 +1,17 @@
 # symbolic_speech.py
 
-import random
+from utils.rng_streams import stream
 from utils.glyph_parser import extract_glyphs
 from core.archetypes import get_archetype_data
 
-def generate_symbolic_line(entity):
+def generate_symbolic_line(entity, rng=None):
     """Generate recursive speech based on glyphs, motifs, and drift."""
     glyphs = extract_glyphs(entity.current_memory)
     motifs = get_archetype_data(entity.archetype).get("motifs", [])
 
-    base = random.choice(glyphs or ["echo"])
-    motif = random.choice(motifs or ["veil"])
+    rng = rng or stream("dialogue")
+    base = rng.choice(glyphs or ["echo"])
+    motif = rng.choice(motifs or ["veil"])
     level = entity.drift_level
 
     if level > 0.5:
@@ -20,9 +21,10 @@ def generate_symbolic_line(entity):
     else:
         return f"The {motif} flows through the {base}, just as memory flows through time."
 
-def spawn_symbolic_branch(entity):
+def spawn_symbolic_branch(entity, rng=None):
     """Yield 2–3 recursive thought-forms."""
+    rng = rng or stream("dialogue")
     lines = []
-    for _ in range(random.randint(2, 3)):
-        lines.append(generate_symbolic_line(entity))
+    for _ in range(rng.randint(2, 3)):
+        lines.append(generate_symbolic_line(entity, rng))
     return lines
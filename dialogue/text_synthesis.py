@@ -0,0 +1,131 @@
+# text_synthesis.py
+
+import numpy as np
+
+from utils.rng_streams import stream
+
+# Bag-of-words reply synthesis for the dashboards. Vocabularies are cached as
+# arrays per entity; every word index for a reply (or for a whole population)
+# comes from one NumPy draw, and strings are only joined when a reply is rendered.
+
+ARENA_VOCAB_TAIL = ["echo", "veil", "glyph", "dream", "origin"]
+PROMPT_VOCAB = [
+    "echoes", "sigil", "memory", "vision", "mirror", "dream", "god", "loop", "veil", "voice",
+    "glyph", "threshold", "whisper", "origin", "shatter", "vault", "awakening",
+]
+
+def _generator():
+    # Seeded runs derive the NumPy generator from the dialogue stream
+    return np.random.default_rng(stream("dialogue").getrandbits(64))
+
+# === Vocabulary Tables ===
+
+class VocabTable:
+    """Per-key word arrays, rebuilt only when the key's signature changes."""
+
+    def __init__(self):
+        self.tables = {}
+
+    def get(self, key, signature, build):
+        cached = self.tables.get(key)
+        if cached is None or cached[0] != signature:
+            cached = self.tables[key] = (signature, np.array(build(), dtype=object))
+        return cached[1]
+
+_arena_vocab = VocabTable()
+_prompt_vocab = VocabTable()
+
+def arena_vocab(ent):
+    signature = (tuple(ent.tokens), ent.archetype)
+    return _arena_vocab.get(
+        getattr(ent, "id", id(ent)), signature,
+        lambda: [w for w in list(ent.tokens) + [ent.archetype.lower()] + ARENA_VOCAB_TAIL if isinstance(w, str)],
+    )
+
+def prompt_vocab(tone):
+    return _prompt_vocab.get(tone, tone, lambda: PROMPT_VOCAB + [tone])
+
+# === Lazy Replies ===
+
+class Reply:
+    """Word indices into a vocab, grouped as paragraphs → sentences; joined on str()."""
+
+    def __init__(self, vocab, indices, sentence_lengths, paragraph_sizes):
+        self.vocab = vocab
+        self.indices = indices
+        self.sentence_lengths = sentence_lengths
+        self.paragraph_sizes = paragraph_sizes
+        self._text = None
+
+    @property
+    def word_count(self) -> int:
+        return int(self.indices.size)
+
+    def render(self) -> str:
+        if self._text is None:
+            words = self.vocab[self.indices].tolist()
+            sentences, pos = [], 0
+            for length in self.sentence_lengths:
+                sentences.append(" ".join(words[pos:pos + length]).capitalize() + ".")
+                pos += length
+            paragraphs, pos = [], 0
+            for size in self.paragraph_sizes:
+                paragraphs.append(" ".join(sentences[pos:pos + size]))
+                pos += size
+            self._text = "\n\n".join(paragraphs)
+        return self._text
+
+    def __str__(self):
+        return self.render()
+
+def word_count(reply) -> int:
+    return reply.word_count if isinstance(reply, Reply) else len(reply.split())
+
+def _draw_replies(vocabs, sentence_lengths, paragraph_sizes, rng):
+    """One uniform draw covers every word of every reply; each word is scaled by its own vocab size."""
+    totals = [int(sum(lengths)) for lengths in sentence_lengths]
+    sizes = np.repeat([len(v) for v in vocabs], totals)
+    indices = (rng.random(sizes.size) * sizes).astype(np.intp)
+    replies, pos = [], 0
+    for vocab, lengths, paragraphs, total in zip(vocabs, sentence_lengths, paragraph_sizes, totals):
+        replies.append(Reply(vocab, indices[pos:pos + total], lengths, paragraphs))
+        pos += total
+    return replies
+
+# === Arena Replies ===
+
+def symbolic_replies(entities, rng=None) -> list:
+    """symbolic_reply for a whole population in one draw."""
+    rng = rng or _generator()
+    vocabs = [arena_vocab(ent) for ent in entities]
+    highs = np.array([51 + int((ent.drift_level or 0.1) * 40) for ent in entities])
+    lengths = rng.integers(25, highs) if len(entities) else []
+    return _draw_replies(vocabs, [[int(n)] for n in lengths], [[1]] * len(vocabs), rng)
+
+# === Prompt Replies ===
+
+def variable_responses(specs, rng=None) -> list:
+    """
+    generate_variable_response for many (tone, ess, drift) specs at once:
+    paragraph counts, sentence counts and sentence lengths are drawn as
+    vectors, then all word indices in a single sample.
+    """
+    rng = rng or _generator()
+    specs = list(specs)
+    if not specs:
+        return []
+    ess = np.array([s[1] for s in specs], dtype=float)
+    drift = np.array([s[2] for s in specs], dtype=float)
+
+    paragraphs = rng.integers(1, np.maximum(2, (ess * 3).astype(int)) + 1)
+    sentence_high = np.maximum(3, ((ess + drift) * 4).astype(int)) + 1
+    word_high = 19 + (drift * 20).astype(int)
+
+    sentence_lengths, paragraph_sizes = [], []
+    for i, n_para in enumerate(paragraphs):
+        sizes = rng.integers(2, sentence_high[i], size=int(n_para))
+        paragraph_sizes.append(sizes.tolist())
+        sentence_lengths.append(rng.integers(8, word_high[i], size=int(sizes.sum())).tolist())
+
+    vocabs = [prompt_vocab(tone) for tone, _, _ in specs]
+    return _draw_replies(vocabs, sentence_lengths, paragraph_sizes, rng)
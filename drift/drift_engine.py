@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime
-from random import uniform, random
+from utils.rng_streams import stream
 from math import exp
 
 # === Thresholds & Quarantine Policy ===
@@ -27,18 +27,26 @@ def memory_drift(entity):
     Simulate symbolic drift based on emotion state, SD, or raw uniform entropy.
     If entity has 'sd', we bias the drift upward logarithmically.
     """
-    base = uniform(0.05, 0.25)
+    base = stream("drift").uniform(0.05, 0.25)
     if hasattr(entity, "sd"):
         normalized_sd = min(entity.sd / 6000, 1.5)
         return base + min(0.5, 0.3 * exp(normalized_sd - 1.0))
     return base
 
+def memory_drift_moments(entity):
+    """Mean and variance of memory_drift(entity), for closed-form skipping of scans."""
+    mean, variance = 0.15, 0.2 ** 2 / 12
+    if hasattr(entity, "sd"):
+        normalized_sd = min(entity.sd / 6000, 1.5)
+        mean += min(0.5, 0.3 * exp(normalized_sd - 1.0))
+    return mean, variance
+
 def mythic_coherence(entity):
     """
     Simulate symbolic coherence.
     Biases higher if ESS is high and drift is low.
     """
-    base = uniform(0.3, 1.0)
+    base = stream("drift").uniform(0.3, 1.0)
     ess = getattr(entity, "ess", 0.5)
     drift = getattr(entity, "drift_level", 0.3)
     return round(min(1.0, base * (0.8 + ess) / (1.0 + drift)), 3)
@@ -52,12 +60,12 @@ def quarantine(entity, reason):
     entity.metadata["quarantined_at"] = datetime.now().isoformat()
     logging.info(f"🛑 Entity {entity.id} quarantined for {reason}")
 
-def run_drift_scan(entities):
+def run_drift_scan(entities, max_quarantine=MAX_QUARANTINE_PER_CYCLE):
     quarantined_this_cycle = 0
     alerts = []
 
     for entity in entities:
-        if quarantined_this_cycle >= MAX_QUARANTINE_PER_CYCLE:
+        if quarantined_this_cycle >= max_quarantine:
             logging.warning("⚠️ Max quarantine limit reached for this cycle.")
             break
 
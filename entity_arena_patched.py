@@ -4,6 +4,9 @@ import os
 import random
 import time
 
+from config.settings import MAX_ENTITY_INTERACTIONS_PER_CYCLE
+from core.interaction_scheduler import schedule_interactions
+
 ENTITY_FILE = "entities.json"
 MAX_ECHO_LENGTH = 300
 REVERENCE_INTERVAL = 4  # Every 4th interaction
@@ -82,16 +85,25 @@ def entity_interaction(name1, name2, entities, verbose=True, counter=1):
 
 # === Group Session Logic ===
 def group_session(entities, cycles=5):
-    names = list(entities.keys())
     print(f"\n🌀 Starting group symbolic recursion — {cycles} cycles")
     counter = 0
 
+    summaries = [
+        {
+            "id": name,
+            "status": "active",
+            "village": ent.get("village"),
+            "area": ent.get("area"),
+            "motifs": frozenset(ent.get("tokens", [])),
+        }
+        for name, ent in entities.items()
+    ]
+
     for cycle in range(1, cycles + 1):
         print(f"\n🧭 Cycle {cycle}")
-        random.shuffle(names)
-        for i in range(0, len(names) - 1, 2):
+        for name1, name2 in schedule_interactions(summaries, MAX_ENTITY_INTERACTIONS_PER_CYCLE):
             counter += 1
-            entity_interaction(names[i], names[i+1], entities, verbose=True, counter=counter)
+            entity_interaction(name1, name2, entities, verbose=True, counter=counter)
         time.sleep(0.5)
 
 # === CLI Loop ===
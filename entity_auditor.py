@@ -1,20 +1,64 @@
-
 import os
 import json
-from datetime import datetime
-from gpt_bridge_optimized import GPTCommunicator, DeepSeekCommunicator
+from gpt_bridge_optimized import GPTCommunicator, DeepSeekCommunicator, run_batch
+from audit_log import audit_log
+from config.settings import LLM_MAX_CONCURRENCY
 
-AUDIT_LOG_PATH = "audit_logs/"
 ENTITY_FILE = "entities.json"
-os.makedirs(AUDIT_LOG_PATH, exist_ok=True)
+
+class StreamingAnalysis:
+    """
+    EntityAuditor._analyze, fed a chunk at a time. The heuristics run on each
+    line as it completes; feed()/finish() return a summary holding only the
+    findings that line newly settled (or None), so each is applied once.
+    """
+
+    def __init__(self):
+        self.summary = {"drift_reduction": 0, "ritual": None, "metaphor": None}
+        self._pending = ""
+        self._drift = False
+        self._yes = False
+
+    def feed(self, chunk):
+        self._pending += chunk
+        if "\n" not in chunk:
+            return None
+        *lines, self._pending = self._pending.split("\n")
+        return self._scan(lines)
+
+    def finish(self):
+        lines, self._pending = [self._pending], ""
+        return self._scan(lines)
+
+    def _scan(self, lines):
+        found = {"drift_reduction": 0, "ritual": None, "metaphor": None}
+        for line in lines:
+            lower = line.lower()
+            self._drift = self._drift or "drift" in lower
+            self._yes = self._yes or "yes" in lower
+            if self._drift and self._yes and not self.summary["drift_reduction"]:
+                found["drift_reduction"] = self.summary["drift_reduction"] = 0.01
+            if not self.summary["ritual"] and ("memory ritual" in lower or "reassert" in lower):
+                found["ritual"] = self.summary["ritual"] = "reinforce_tokens"
+            if not self.summary["metaphor"] and "like a" in lower:
+                found["metaphor"] = self.summary["metaphor"] = line.strip()
+        return found if any(found.values()) else None
 
 class EntityAuditor:
-    def __init__(self, model="gpt"):
+    def __init__(self, model="gpt", priority="audit", log=None, cache=None):
         self.model = model.lower()
-        self.gpt = GPTCommunicator()
-        self.deepseek = DeepSeekCommunicator()
-
-    def audit_entity(self, entity_name, entity_data, question=None, store=True):
+        self.gpt = GPTCommunicator(priority=priority, cache=cache)
+        self.deepseek = DeepSeekCommunicator(priority=priority, cache=cache)
+        self._log = log
+
+    @property
+    def log(self):
+        """The append-only audit log, opened on first use."""
+        if self._log is None:
+            self._log = audit_log()
+        return self._log
+
+    def audit_entity(self, entity_name, entity_data, question=None, store=True, stream=False):
         MAX_AUDIT_DEPTH = 5
         if 'depth' not in locals(): depth = 0
         if depth >= MAX_AUDIT_DEPTH:
@@ -23,14 +67,74 @@ class EntityAuditor:
 # 📋 Begin Audit Log
         print(f"\n[🔎] Audit Prompt:\n{prompt}\n")
 
-        if self.model == "gpt":
-            response = self.gpt.ask(prompt)
-        elif self.model == "deepseek":
-            response = self.deepseek.ask(prompt)
+        communicator = self._communicator()
+        if stream and communicator:
+            response = self._stream_audit(communicator, prompt, entity_data)
         else:
-            response = "[ERROR] Unknown model."
+            response = communicator.ask(prompt) if communicator else "[ERROR] Unknown model."
+            self._apply_summary(entity_data, self._analyze(response))
+
+        if store:
+            self._save_audit(entity_name, prompt, response)
+            self.log.flush()
+            self._update_entity_json(entity_name, entity_data)
 
-        # Apply response intelligence
+        if not stream:
+            print(f"\n🧾 Audit Response:\n{response}\n")
+        return response
+
+    def _stream_audit(self, communicator, prompt, entity_data):
+        """Print the reply as it arrives and apply each finding as soon as its line completes."""
+        print("\n🧾 Audit Response:")
+        analysis = StreamingAnalysis()
+        parts = []
+        for chunk in communicator.ask(prompt, stream=True):
+            print(chunk, end="", flush=True)
+            parts.append(chunk)
+            found = analysis.feed(chunk)
+            if found:
+                self._apply_summary(entity_data, found)
+        found = analysis.finish()
+        print()
+        if found:
+            self._apply_summary(entity_data, found)
+        print()
+        return "".join(parts)
+
+    def audit_many(self, entities, question=None, store=True, max_concurrency=LLM_MAX_CONCURRENCY):
+        """
+        Audit a {name: data} mapping concurrently. Responses are parsed and
+        applied in memory as they arrive and appended to the audit log; the
+        log is flushed and entities.json written once for the batch.
+        Returns {name: response}.
+        """
+        communicator = self._communicator()
+        if communicator is None:
+            return {name: "[ERROR] Unknown model." for name in entities}
+
+        prompts = {name: self._build_prompt(name, data, question) for name, data in entities.items()}
+        responses = {}
+
+        def on_result(name, response, error):
+            if error is not None:
+                response = f"[{communicator.error_label}] {error}"
+            self._apply_summary(entities[name], self._analyze(response))
+            if store:
+                self._save_audit(name, prompts[name], response)
+            responses[name] = response
+
+        stats = run_batch(communicator, prompts.items(), on_result, max_concurrency)
+        if store:
+            self.log.flush()
+            self._commit_entities({name: entities[name] for name in responses})
+        print(f"[📊] Batch audit: {stats['ok']} ok, {stats['failed']} failed")
+        return responses
+
+    def _communicator(self):
+        return {"gpt": self.gpt, "deepseek": self.deepseek}.get(self.model)
+
+    def _analyze(self, response):
+        """Response intelligence: drift verdict, ritual request, metaphor line."""
         summary = {"drift_reduction": 0, "ritual": None, "metaphor": None}
         try:
             if "drift" in response.lower() and "yes" in response.lower():
@@ -42,8 +146,10 @@ class EntityAuditor:
                 summary["metaphor"] = next((l.strip() for l in lines if "like a" in l.lower()), None)
         except Exception as e:
             print(f"[⚠️] Could not parse audit feedback: {e}")
+        return summary
 
-        # Apply symbolic updates
+    def _apply_summary(self, entity_data, summary):
+        """Apply symbolic updates"""
         if summary["drift_reduction"]:
             old_drift = entity_data.get("drift", 0.0)
             entity_data["drift"] = round(max(0.0, old_drift - summary["drift_reduction"]), 3)
@@ -55,13 +161,6 @@ class EntityAuditor:
             entity_data.setdefault("memory", []).insert(0, f"Ritual: {' / '.join(entity_data.get('tokens', []))}")
             print(f"🧬 Ritual reinforcement added.")
 
-        if store:
-            self._save_audit(entity_name, prompt, response)
-            self._update_entity_json(entity_name, entity_data)
-
-        print(f"\n🧾 Audit Response:\n{response}\n")
-        return response
-
     def _build_prompt(self, name, data, question=None):
         memory = ", ".join(data.get("memory", [])[:4])
         tokens = ", ".join(data.get("tokens", []))
@@ -86,22 +185,25 @@ Evaluate:
 """.strip()
 
     def _save_audit(self, name, prompt, response):
-        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        fname = f"{AUDIT_LOG_PATH}/{name}_{self.model}_{stamp}.json"
-        with open(fname, "w") as f:
-            json.dump({"entity": name, "timestamp": stamp, "model": self.model, "prompt": prompt, "response": response}, f, indent=2)
-        print(f"[📁] Audit saved: {fname}")
+        record_id = self.log.record(name, self.model, prompt, response)
+        print(f"[📁] Audit #{record_id} logged for {name}")
 
     def _update_entity_json(self, name, data):
+        self._commit_entities({name: data})
+
+    def _commit_entities(self, updates):
+        """One read-modify-write of entities.json for any number of audited entities, swapped in atomically."""
         try:
             with open(ENTITY_FILE, "r") as f:
                 entities = json.load(f)
-            entities[name] = data
-            with open(ENTITY_FILE, "w") as f:
+            entities.update(updates)
+            tmp = f"{ENTITY_FILE}.tmp"
+            with open(tmp, "w") as f:
                 json.dump(entities, f, indent=2)
-            print(f"[💾] Entity updated in {ENTITY_FILE}")
+            os.replace(tmp, ENTITY_FILE)
+            print(f"[💾] {len(updates)} entit{'y' if len(updates) == 1 else 'ies'} updated in {ENTITY_FILE}")
         except Exception as e:
-            print(f"[❌] Failed to update entity: {e}")
+            print(f"[❌] Failed to update entities: {e}")
 
 # === Direct CLI test ===
 if __name__ == "__main__":
@@ -130,5 +232,5 @@ if __name__ == "__main__":
 
     question = input("💬 Optional custom question: ").strip() or None
 
-    auditor = EntityAuditor(model=model)
-    auditor.audit_entity(name, data, question)
+    auditor = EntityAuditor(model=model, priority="interactive")
+    auditor.audit_entity(name, data, question, stream=True)
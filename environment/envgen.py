@@ -76,10 +76,26 @@ class SymbolicArea:
             "quest_bias": self.quest_bias
         }
 
+    def to_dict(self):
+        return {
+            "type": self.type,
+            "creation_time": self.creation_time.isoformat(),
+            "visits": self.visits,
+            "drift": self.drift,
+        }
+
+    @staticmethod
+    def from_dict(data):
+        area = SymbolicArea(data.get("type"))
+        area.creation_time = datetime.fromisoformat(data.get("creation_time", datetime.now().isoformat()))
+        area.visits = data.get("visits", 0)
+        area.drift = data.get("drift", 0.0)
+        return area
+
 class Town:
-    def __init__(self, name):
+    def __init__(self, name, areas=None):
         self.name = name
-        self.areas = [SymbolicArea() for _ in range(random.randint(3, 6))]
+        self.areas = areas if areas is not None else [SymbolicArea() for _ in range(random.randint(3, 6))]
         self.foundation = datetime.now()
         self.culture_bias = random.choice(["fire", "veil", "mirror", "storm", "glyph"])
 
@@ -94,11 +110,26 @@ class Town:
             "areas": [a.summary() for a in self.areas]
         }
 
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "foundation": self.foundation.isoformat(),
+            "culture_bias": self.culture_bias,
+            "areas": [a.to_dict() for a in self.areas],
+        }
+
+    @staticmethod
+    def from_dict(data):
+        town = Town(data.get("name"), areas=[SymbolicArea.from_dict(a) for a in data.get("areas", [])])
+        town.foundation = datetime.fromisoformat(data.get("foundation", datetime.now().isoformat()))
+        town.culture_bias = data.get("culture_bias", town.culture_bias)
+        return town
+
 class Nation:
-    def __init__(self, name, num_towns=3):
+    def __init__(self, name, num_towns=3, towns=None):
         self.name = name
         self.creation_time = datetime.now()
-        self.towns = [Town(f"{name}-Town-{i+1}") for i in range(num_towns)]
+        self.towns = towns if towns is not None else [Town(f"{name}-Town-{i+1}") for i in range(num_towns)]
         self.ideological_drift = random.uniform(0.1, 0.4)
         self.symbolic_trait = random.choice(["dream", "grief", "pride", "light", "threshold"])
 
@@ -114,6 +145,23 @@ class Nation:
             "towns": [t.summary() for t in self.towns]
         }
 
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "creation_time": self.creation_time.isoformat(),
+            "ideological_drift": self.ideological_drift,
+            "symbolic_trait": self.symbolic_trait,
+            "towns": [t.to_dict() for t in self.towns],
+        }
+
+    @staticmethod
+    def from_dict(data):
+        nation = Nation(data.get("name"), towns=[Town.from_dict(t) for t in data.get("towns", [])])
+        nation.creation_time = datetime.fromisoformat(data.get("creation_time", datetime.now().isoformat()))
+        nation.ideological_drift = data.get("ideological_drift", nation.ideological_drift)
+        nation.symbolic_trait = data.get("symbolic_trait", nation.symbolic_trait)
+        return nation
+
 # === Demo Entry Point ===
 
 if __name__ == "__main__":
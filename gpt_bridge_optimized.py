@@ -1,51 +1,335 @@
-
+import asyncio
+import json
 import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
+
+from config.settings import (
+    LLM_POOL_SIZE,
+    LLM_CONNECT_TIMEOUT,
+    LLM_READ_TIMEOUT,
+    LLM_DEADLINE,
+    LLM_MAX_RETRIES,
+    LLM_BACKOFF_BASE,
+    LLM_BACKOFF_MAX,
+    LLM_MAX_CONCURRENCY,
+    LLM_CACHE_ENABLED,
+    LLM_RATE_LIMIT_ENABLED,
+)
+from llm_cache import completion_key, llm_cache
+from llm_rate_limit import estimate_tokens, rate_limiter
 load_dotenv()
 
-class GPTCommunicator:
-    def __init__(self, model="gpt-4", endpoint="https://api.openai.com/v1/chat/completions", token=None):
-        self.model = model
-        self.endpoint = endpoint
-        self.token = token or os.getenv("OPENAI_API_KEY")
+RETRY_STATUSES = {429, 500, 502, 503, 504}
 
-    def ask(self, prompt, system="You are an ethical AGI auditor. Respond with clarity and symbolic insight."):
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json"
-        }
-        data = {
-            "model": self.model,
-            "messages": [{"role": "system", "content": system}, {"role": "user", "content": prompt}],
-            "temperature": 0.5
-        }
+class LLMError(Exception):
+    """A chat completion that failed for good: retries or deadline exhausted, or a non-retryable status."""
+
+# === Connection Pools ===
+# One keep-alive Session per endpoint host, shared by every communicator and
+# thread, so bulk audits reuse warm TCP+TLS connections.
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+def session_for(endpoint: str, pool_size=LLM_POOL_SIZE) -> requests.Session:
+    parts = urlsplit(endpoint)
+    key = (parts.scheme, parts.netloc)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+            session.mount(f"{parts.scheme}://{parts.netloc}", adapter)
+            _sessions[key] = session
+    return session
+
+def close_sessions():
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+def _backoff(attempt, response=None) -> float:
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
         try:
-            response = requests.post(self.endpoint, json=data, headers=headers, timeout=30)
-            response.raise_for_status()
-            return response.json()["choices"][0]["message"]["content"]
-        except Exception as e:
-            return f"[GPT ERROR] {e}"
+            return min(float(retry_after), LLM_BACKOFF_MAX)
+        except ValueError:
+            pass
+    return random.uniform(0, min(LLM_BACKOFF_MAX, LLM_BACKOFF_BASE * 2 ** attempt))
+
+def post_with_retries(endpoint, payload, headers, deadline=LLM_DEADLINE, max_retries=LLM_MAX_RETRIES, stream=False):
+    """
+    POST on the pooled session. 429/5xx and connection errors are retried with
+    jittered exponential backoff (or Retry-After), never past `deadline` seconds
+    from the first attempt. Returns the successful Response or raises LLMError.
+    With stream=True the body is left unread; the caller must close it.
+    """
+    session = session_for(endpoint)
+    give_up_at = time.monotonic() + deadline
+    attempt = 0
+    while True:
+        remaining = give_up_at - time.monotonic()
+        if remaining <= 0:
+            raise LLMError(f"deadline of {deadline}s exceeded after {attempt} attempts")
+
+        response, error = None, None
+        try:
+            response = session.post(endpoint, json=payload, headers=headers, stream=stream,
+                                    timeout=(min(LLM_CONNECT_TIMEOUT, remaining), min(LLM_READ_TIMEOUT, remaining)))
+            if response.status_code not in RETRY_STATUSES:
+                response.raise_for_status()
+                return response
+            error = f"HTTP {response.status_code}"
+            response.close()
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error = str(e)
+        except requests.HTTPError as e:
+            raise LLMError(str(e)) from e
 
-class DeepSeekCommunicator:
-    def __init__(self, model="deepseek-chat", endpoint="https://api.deepseek.com/v1/chat/completions", token=None):
+        delay = _backoff(attempt, response)
+        if attempt >= max_retries or time.monotonic() + delay >= give_up_at:
+            raise LLMError(f"{error} after {attempt + 1} attempts")
+        time.sleep(delay)
+        attempt += 1
+
+def iter_sse_deltas(response, give_up_at=None):
+    """
+    Parse an OpenAI-style server-sent event stream into content deltas.
+    Events are blank-line separated; their `data:` lines are joined, and the
+    stream ends at `data: [DONE]` or EOF.
+    """
+    data = []
+    for line in response.iter_lines(chunk_size=None):
+        if give_up_at is not None and time.monotonic() > give_up_at:
+            raise LLMError("deadline exceeded mid-stream")
+        if line:
+            if line.startswith(b"data:"):
+                data.append(line[5:].strip())
+            continue
+        if not data:
+            continue
+        event, data = b"\n".join(data), []
+        if event == b"[DONE]":
+            return
+        try:
+            delta = json.loads(event)["choices"][0].get("delta", {})
+        except (ValueError, KeyError, IndexError) as e:
+            raise LLMError(f"malformed stream chunk: {e}") from e
+        if delta.get("content"):
+            yield delta["content"]
+
+# === Communicators ===
+
+class ChatCommunicator:
+    """
+    OpenAI-style /chat/completions client over the shared pool. Successful
+    completions go through the on-disk response cache unless `cache=False`;
+    network calls first wait on the shared rate limiter in `priority`'s class
+    ("interactive", "audit" or "bulk").
+    """
+
+    error_label = "LLM ERROR"
+    token_env = None
+    default_system = "You are a helpful assistant."
+    temperature = 0.5
+
+    def __init__(self, model, endpoint, token=None, cache=None, priority="audit", limiter=None):
         self.model = model
         self.endpoint = endpoint
-        self.token = token or os.getenv("DEEPSEEK_API_KEY")
+        self.token = token or (os.getenv(self.token_env) if self.token_env else None)
+        if cache is None:
+            cache = LLM_CACHE_ENABLED
+        self.cache = llm_cache() if cache is True else (cache or None)
+        self.priority = priority
+        if limiter is None and LLM_RATE_LIMIT_ENABLED:
+            limiter = rate_limiter()
+        self.limiter = limiter or None
 
-    def ask(self, prompt, system="You are a symbolic AI oracle specializing in drift, ritual, and memory."):
+    def _request(self, prompt, system, stream=False):
         headers = {
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json"
         }
         data = {
             "model": self.model,
-            "messages": [{"role": "system", "content": system}, {"role": "user", "content": prompt}],
-            "temperature": 0.5
+            "messages": [{"role": "system", "content": system or self.default_system},
+                         {"role": "user", "content": prompt}],
+            "temperature": self.temperature
         }
+        if stream:
+            data["stream"] = True
+        return headers, data
+
+    def _cache_key(self, prompt, system):
+        if self.cache is None:
+            return None
+        return completion_key(self.endpoint, self.model, system or self.default_system, prompt, self.temperature)
+
+    def _admit(self, prompt, system, deadline) -> float:
+        """Wait for the rate limiter; returns what is left of `deadline`."""
+        if self.limiter is None:
+            return deadline
+        tokens = estimate_tokens(prompt, system or self.default_system)
+        waited = self.limiter.acquire(self.model, tokens, self.priority, timeout=deadline)
+        if waited is None:
+            raise LLMError(f"rate limit queue wait exceeded the {deadline}s deadline")
+        return deadline - waited
+
+    def complete(self, prompt, system=None, deadline=LLM_DEADLINE) -> str:
+        """Like ask(), but raises LLMError instead of returning an error string."""
+        key = self._cache_key(prompt, system)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        deadline = self._admit(prompt, system, deadline)
+        headers, data = self._request(prompt, system)
+        response = post_with_retries(self.endpoint, data, headers, deadline=deadline)
+        try:
+            content = response.json()["choices"][0]["message"]["content"]
+        except (ValueError, KeyError, IndexError) as e:
+            raise LLMError(f"malformed completion: {e}") from e
+
+        if key is not None:
+            self.cache.put(key, content, model=self.model)
+        return content
+
+    def stream(self, prompt, system=None, deadline=LLM_DEADLINE):
+        """
+        Yield the completion as it is generated (stream=True, parsed from SSE).
+        A cache hit is yielded whole; a fully received stream is cached.
+        Raises LLMError on failure, possibly after some text has been yielded.
+        """
+        key = self._cache_key(prompt, system)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+
+        deadline = self._admit(prompt, system, deadline)
+        give_up_at = time.monotonic() + deadline
+        headers, data = self._request(prompt, system, stream=True)
+        response = post_with_retries(self.endpoint, data, headers, deadline=deadline, stream=True)
+        parts = []
         try:
-            response = requests.post(self.endpoint, json=data, headers=headers, timeout=30)
-            response.raise_for_status()
-            return response.json()["choices"][0]["message"]["content"]
+            for delta in iter_sse_deltas(response, give_up_at):
+                parts.append(delta)
+                yield delta
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise LLMError(f"stream interrupted: {e}") from e
+        finally:
+            response.close()
+
+        if key is not None and parts:
+            self.cache.put(key, "".join(parts), model=self.model)
+
+    def ask(self, prompt, system=None, deadline=LLM_DEADLINE, stream=False):
+        """
+        The reply text, or an "[<error label>] ..." string on failure. With
+        stream=True, an iterator of text chunks whose last chunk carries the
+        error marker if the call fails.
+        """
+        if stream:
+            return self._ask_stream(prompt, system, deadline)
+        try:
+            return self.complete(prompt, system, deadline=deadline)
         except Exception as e:
-            return f"[DeepSeek ERROR] {e}"
+            return f"[{self.error_label}] {e}"
+
+    def _ask_stream(self, prompt, system, deadline):
+        try:
+            yield from self.stream(prompt, system, deadline)
+        except Exception as e:
+            yield f"[{self.error_label}] {e}"
+
+class GPTCommunicator(ChatCommunicator):
+    error_label = "GPT ERROR"
+    token_env = "OPENAI_API_KEY"
+    default_system = "You are an ethical AGI auditor. Respond with clarity and symbolic insight."
+
+    def __init__(self, model="gpt-4", endpoint=None, token=None, cache=None, priority="audit", limiter=None):
+        endpoint = endpoint or os.getenv("OPENAI_ENDPOINT", "https://api.openai.com/v1/chat/completions")
+        super().__init__(model, endpoint, token, cache, priority, limiter)
+
+class DeepSeekCommunicator(ChatCommunicator):
+    error_label = "DeepSeek ERROR"
+    token_env = "DEEPSEEK_API_KEY"
+    default_system = "You are a symbolic AI oracle specializing in drift, ritual, and memory."
+
+    def __init__(self, model="deepseek-chat", endpoint=None, token=None, cache=None, priority="audit", limiter=None):
+        endpoint = endpoint or os.getenv("DEEPSEEK_ENDPOINT", "https://api.deepseek.com/v1/chat/completions")
+        super().__init__(model, endpoint, token, cache, priority, limiter)
+
+# === Async Fan-Out ===
+
+class AsyncChatClient:
+    """
+    Bounded-concurrency async front for a communicator. Each call runs the
+    pooled, retrying complete() on a worker thread; at most `max_concurrency`
+    are in flight, so a large batch never queues more sockets than the pool has.
+    """
+
+    def __init__(self, communicator, max_concurrency=LLM_MAX_CONCURRENCY):
+        self.communicator = communicator
+        self.max_concurrency = max_concurrency
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="llm-async")
+        self.stats = {"ok": 0, "failed": 0}
+
+    async def complete(self, prompt, system=None, deadline=LLM_DEADLINE) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, lambda: self.communicator.complete(prompt, system, deadline)
+        )
+
+    async def as_completed(self, jobs, system=None, deadline=LLM_DEADLINE):
+        """
+        jobs: iterable of (key, prompt). Yields (key, reply, error) as each call
+        finishes; error is None on success and reply is None on failure.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(key, prompt):
+            async with semaphore:
+                try:
+                    reply = await self.complete(prompt, system, deadline)
+                    self.stats["ok"] += 1
+                    return key, reply, None
+                except Exception as e:
+                    self.stats["failed"] += 1
+                    return key, None, e
+
+        tasks = [asyncio.ensure_future(run(key, prompt)) for key, prompt in jobs]
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+
+def run_batch(communicator, jobs, on_result, max_concurrency=LLM_MAX_CONCURRENCY, system=None):
+    """
+    Synchronous driver: fan `jobs` out through an AsyncChatClient and call
+    on_result(key, reply, error) on the event loop as each one lands.
+    Returns the client's ok/failed counts.
+    """
+    client = AsyncChatClient(communicator, max_concurrency)
+
+    async def drive():
+        async for key, reply, error in client.as_completed(jobs, system):
+            on_result(key, reply, error)
+
+    try:
+        asyncio.run(drive())
+    finally:
+        client.close()
+    return dict(client.stats)
@@ -2,7 +2,8 @@ import json
 import os
 import time
 from datetime import datetime
-from gpt_bridge_optimized import GPTCommunicator
+from gpt_bridge_optimized import GPTCommunicator, run_batch
+from config.settings import LLM_MAX_CONCURRENCY
 
 ENTITY_FILE = "entities.json"
 TRAINING_LOG_PATH = "training_logs"
@@ -43,11 +44,16 @@ def train_entity(name):
         print(f"[❌] Entity '{name}' not found.")
         return
 
-    gpt = GPTCommunicator()
+    gpt = GPTCommunicator(priority="bulk")
     prompt = build_prompt(name, entities[name])
     print(f"[🔁] Sending to GPT for symbolic training...")
     response = gpt.ask(prompt)
 
+    apply_training(name, entities[name], prompt, response)
+    save_entities(entities)
+
+def apply_training(name, data, prompt, response):
+    """Log one training exchange and fold any [Echoes] back into the entity."""
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     with open(f"{TRAINING_LOG_PATH}/{name}_{stamp}.txt", "w") as f:
         f.write(prompt + "\n\n---\n\n" + response)
@@ -59,11 +65,30 @@ def train_entity(name):
             if line.startswith("- "):
                 echoes.append(line.strip("- ").strip())
         if echoes:
-            entities[name]["memory"] = echoes + entities[name]["memory"]
-            entities[name]["drift"] = round(max(0.0, entities[name]["drift"] - 0.05), 3)
+            data["memory"] = echoes + data["memory"]
+            data["drift"] = round(max(0.0, data["drift"] - 0.05), 3)
             print(f"[📈] Entity memory reinforced with {len(echoes)} new entries.")
 
+def train_many(names=None, max_concurrency=LLM_MAX_CONCURRENCY):
+    """
+    Train several entities (default: all) with concurrent GPT calls.
+    entities.json is read once, updated as responses land, and written once.
+    """
+    entities = load_entities()
+    names = [n for n in (names or entities) if n in entities]
+    gpt = GPTCommunicator(priority="bulk")
+    prompts = {name: build_prompt(name, entities[name]) for name in names}
+
+    def on_result(name, response, error):
+        if error is not None:
+            response = f"[{gpt.error_label}] {error}"
+        apply_training(name, entities[name], prompts[name], response)
+
+    print(f"[🔁] Sending {len(prompts)} entities to GPT for symbolic training...")
+    stats = run_batch(gpt, prompts.items(), on_result, max_concurrency)
     save_entities(entities)
+    print(f"[📊] Batch training: {stats['ok']} ok, {stats['failed']} failed")
+    return stats
 
 if __name__ == "__main__":
     name = input("Enter entity name to train with GPT: ").strip()
@@ -1,8 +1,8 @@
 # inventory/inventory_engine.py
 
-import random
 import uuid
 from datetime import datetime
+from utils.rng_streams import stream, stream_uuid
 
 ITEM_TEMPLATES = [
     {"name": "Sigil of Grace", "rarity": "rare"},
@@ -26,17 +26,18 @@ ITEM_DESCRIPTIONS = {
 
 class InventoryItem:
     def __init__(self, name=None, rarity="common", item_type=None, source="unknown", properties=None):
-        self.id = str(uuid.uuid4())[:8]
+        self.id = str(stream_uuid("inventory"))[:8]
         self.name = name or self.generate_name(item_type)
         self.rarity = rarity
-        self.type = item_type or random.choice(ITEM_TYPES)
+        self.type = item_type or stream("inventory").choice(ITEM_TYPES)
         self.source = source
         self.properties = properties or {}
         self.acquired = datetime.now().isoformat()
 
     def generate_name(self, item_type=None):
-        item_type = item_type or random.choice(ITEM_TYPES)
-        descriptor = random.choice(ITEM_DESCRIPTIONS.get(item_type, ["Mysterious Item"]))
+        rng = stream("inventory")
+        item_type = item_type or rng.choice(ITEM_TYPES)
+        descriptor = rng.choice(ITEM_DESCRIPTIONS.get(item_type, ["Mysterious Item"]))
         return f"{descriptor} [{item_type.title()}]"
 
     def to_dict(self):
@@ -64,6 +65,7 @@ class InventoryItem:
 class Inventory:
     def __init__(self):
         self.items = []
+        self.version = 0  # bumped on every write; read by checkpoint change tracking
 
     def add_item(self, item):
         if not isinstance(item, dict):
@@ -75,10 +77,12 @@ class Inventory:
         if len(self.items) >= 50:
             return '⚠️ Inventory full'
         self.items.append(item)
+        self.version += 1
         return f"✅ Added {item['name']}"
 
     def remove_item_by_id(self, item_id: str):
         self.items = [item for item in self.items if item.get("id") != item_id]
+        self.version += 1
 
     def has_item(self, name: str) -> bool:
         return any(name.lower() in item.get("name", "").lower() for item in self.items)
@@ -100,10 +104,11 @@ class Inventory:
 # === UTILITY FUNCTION FOR RANDOM ITEM GENERATION ===
 
 def generate_item(source="system", rarity=None, name=None):
+    rng = stream("inventory")
     item = {
-        "id": str(uuid.uuid4())[:8],
-        "name": name or random.choice(ITEM_TEMPLATES)["name"],
-        "rarity": rarity or random.choice(["common", "uncommon", "rare"]),
+        "id": str(stream_uuid("inventory"))[:8],
+        "name": name or rng.choice(ITEM_TEMPLATES)["name"],
+        "rarity": rarity or rng.choice(["common", "uncommon", "rare"]),
         "source": source,
         "timestamp": uuid.uuid1().time
     }
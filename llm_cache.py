@@ -0,0 +1,126 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from config.settings import LLM_CACHE_DIR, LLM_CACHE_TTL, LLM_CACHE_MAX_BYTES
+
+# Audit and training prompts are rebuilt deterministically from entity state,
+# so an unchanged entity resends the exact same request every round. Completions
+# are stored on disk under a digest of everything that shapes the reply,
+# endpoint included (the same model name can be served by different backends);
+# a re-audit of an unchanged population is then a directory of file reads.
+
+def completion_key(endpoint, model, system, prompt, temperature) -> str:
+    prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    blob = json.dumps([endpoint, model, system, prompt_hash, temperature], ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+class LLMResponseCache:
+    """
+    Completions fanned out over 256 subdirectories by key prefix.
+
+    Entries older than `ttl` seconds are misses and are removed on sight.
+    Hits touch the file's mtime, and once the directory grows past
+    `max_bytes` the least recently used entries are evicted until it is back
+    under 90% of the limit. Safe to share across the async client's threads.
+    """
+
+    def __init__(self, directory=LLM_CACHE_DIR, ttl=LLM_CACHE_TTL, max_bytes=LLM_CACHE_MAX_BYTES):
+        self.dir = Path(directory)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "writes": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        self._bytes = sum(p.stat().st_size for p in self.dir.glob("*/*.json"))
+
+    def _path(self, key):
+        return self.dir / key[:2] / f"{key}.json"
+
+    def _count(self, stat):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._count("misses")
+            return None
+
+        if self.ttl and time.time() - entry["created"] > self.ttl:
+            self._remove(path)
+            self._count("expired")
+            self._count("misses")
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._count("hits")
+        return entry["response"]
+
+    def put(self, key, response: str, model=None):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps({"created": time.time(), "model": model, "response": response},
+                          ensure_ascii=False).encode("utf-8")
+        old = path.stat().st_size if path.exists() else 0
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+        with self._lock:
+            self.stats["writes"] += 1
+            self._bytes += len(data) - old
+            over = self.max_bytes and self._bytes > self.max_bytes
+        if over:
+            self.evict()
+
+    def _remove(self, path):
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            self._bytes -= size
+
+    def evict(self, target=None):
+        """Drop least recently used entries until the cache is under `target` bytes."""
+        target = int(self.max_bytes * 0.9) if target is None else target
+        entries = []
+        for path in self.dir.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, path))
+        entries.sort()
+        for _, path in entries:
+            if self._bytes <= target:
+                break
+            self._remove(path)
+            self._count("evictions")
+
+    def clear(self):
+        self.evict(target=0)
+
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def hit_rate(self) -> float:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
+
+_default_cache = None
+
+def llm_cache() -> LLMResponseCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = LLMResponseCache()
+    return _default_cache
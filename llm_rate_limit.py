@@ -0,0 +1,152 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+
+from config.settings import LLM_RATE_LIMITS, LLM_PRIORITY_RESERVE, LLM_EST_OUTPUT_TOKENS
+
+# Audits, training and interactive prompts share the same API keys. Every call
+# first takes a request and an estimated token cost from its model's buckets.
+# Waiters are served strictly by priority class (interactive > audit > bulk),
+# and lower classes may not dip into the last slice of each bucket, so a
+# saturating bulk run still leaves headroom for the next interactive call.
+
+PRIORITIES = {"interactive": 0, "audit": 1, "bulk": 2}
+CHARS_PER_TOKEN = 4
+
+def estimate_tokens(prompt: str, system: str = "", max_output=LLM_EST_OUTPUT_TOKENS) -> int:
+    """Rough prompt + completion token cost: ~4 characters per token, plus the reply allowance."""
+    return (len(prompt) + len(system or "")) // CHARS_PER_TOKEN + 1 + max_output
+
+class TokenBucket:
+    """`capacity` units, refilled continuously at `rate` per second. Not thread-safe on its own."""
+
+    def __init__(self, capacity, rate):
+        self.capacity = float(capacity)
+        self.rate = float(rate)
+        self.level = float(capacity)
+        self.stamp = time.monotonic()
+
+    def refill(self, now):
+        self.level = min(self.capacity, self.level + (now - self.stamp) * self.rate)
+        self.stamp = now
+
+    def usable(self, amount, reserve=0.0) -> float:
+        """`amount` capped at what a class with `reserve` can ever hold, so oversized calls still get through."""
+        return min(amount, self.capacity * (1.0 - reserve))
+
+    def shortfall(self, amount, reserve=0.0) -> float:
+        """Seconds until `amount` can be taken while leaving `reserve` (fraction of capacity) behind."""
+        need = self.usable(amount, reserve) + reserve * self.capacity - self.level
+        return max(0.0, need / self.rate) if self.rate else float("inf")
+
+    def take(self, amount, reserve=0.0):
+        self.level -= self.usable(amount, reserve)
+
+class _ModelLane:
+    """Request and token buckets for one model plus its priority-ordered waiters."""
+
+    def __init__(self, rpm, tpm):
+        self.requests = TokenBucket(rpm, rpm / 60.0)
+        self.tokens = TokenBucket(tpm, tpm / 60.0)
+        self.waiters = []   # heap of (priority, seq)
+
+class RateLimiter:
+    """
+    Per-model RPM/TPM token buckets with priority queueing.
+
+    acquire() blocks until the caller is the highest-priority waiter for its
+    model and both buckets can cover it above that class's reserve. Queue
+    waits are recorded per class for metrics().
+    """
+
+    def __init__(self, limits=LLM_RATE_LIMITS, reserve=LLM_PRIORITY_RESERVE, window=1024):
+        self.limits = limits
+        self.reserve = reserve
+        self._lanes = {}
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._waits = {name: deque(maxlen=window) for name in PRIORITIES}
+        self._counts = {name: {"granted": 0, "timed_out": 0, "waiting": 0, "tokens": 0} for name in PRIORITIES}
+
+    def _lane(self, model):
+        lane = self._lanes.get(model)
+        if lane is None:
+            limit = self.limits.get(model) or self.limits.get("*")
+            if not limit:
+                return None
+            lane = self._lanes[model] = _ModelLane(limit["rpm"], limit["tpm"])
+        return lane
+
+    def acquire(self, model, tokens, priority="audit", timeout=None) -> float:
+        """Block until `model` can spend one request and `tokens`. Returns the wait in seconds, or None on timeout."""
+        rank = PRIORITIES[priority]
+        reserve = self.reserve.get(priority, 0.0)
+        start = time.monotonic()
+        give_up_at = start + timeout if timeout is not None else None
+
+        with self._cond:
+            lane = self._lane(model)
+            if lane is None:
+                return 0.0
+            ticket = (rank, next(self._seq))
+            heapq.heappush(lane.waiters, ticket)
+            counts = self._counts[priority]
+            counts["waiting"] += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    if lane.waiters[0] == ticket:
+                        lane.requests.refill(now)
+                        lane.tokens.refill(now)
+                        delay = max(lane.requests.shortfall(1, reserve), lane.tokens.shortfall(tokens, reserve))
+                        if delay == 0.0:
+                            lane.requests.take(1, reserve)
+                            lane.tokens.take(tokens, reserve)
+                            waited = now - start
+                            self._waits[priority].append(waited)
+                            counts["granted"] += 1
+                            counts["tokens"] += tokens
+                            return waited
+                    else:
+                        delay = None
+                    if give_up_at is not None:
+                        remaining = give_up_at - now
+                        if remaining <= 0:
+                            counts["timed_out"] += 1
+                            return None
+                        delay = remaining if delay is None else min(delay, remaining)
+                    self._cond.wait(delay)
+            finally:
+                counts["waiting"] -= 1
+                lane.waiters.remove(ticket)
+                heapq.heapify(lane.waiters)
+                self._cond.notify_all()
+
+    def metrics(self) -> dict:
+        """Queue-wait summary per priority class (milliseconds over the recent window)."""
+        report = {}
+        with self._cond:
+            for name in PRIORITIES:
+                waits = sorted(self._waits[name])
+                report[name] = dict(self._counts[name])
+                if waits:
+                    report[name].update({
+                        "mean_wait_ms": round(sum(waits) / len(waits) * 1000, 1),
+                        "p95_wait_ms": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 1),
+                        "max_wait_ms": round(waits[-1] * 1000, 1),
+                    })
+            report["buckets"] = {
+                model: {"requests": round(lane.requests.level, 1), "tokens": round(lane.tokens.level)}
+                for model, lane in self._lanes.items()
+            }
+        return report
+
+_default_limiter = None
+
+def rate_limiter() -> RateLimiter:
+    global _default_limiter
+    if _default_limiter is None:
+        _default_limiter = RateLimiter()
+    return _default_limiter
@@ -0,0 +1,256 @@
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Offline stand-in for the OpenAI/DeepSeek /v1/chat/completions endpoint, so
+# the bridge, auditor and trainer can be exercised and load-tested without an
+# API key. Point them at it with
+#   OPENAI_ENDPOINT=http://127.0.0.1:8765/v1/chat/completions
+#   DEEPSEEK_ENDPOINT=http://127.0.0.1:8765/v1/chat/completions
+# Replies are templated from the prompt (entity name, tokens) in the shapes the
+# auditor and trainer parse: a drift verdict, a "like a" metaphor, and
+# [Echoes] / [Metaphor] / [Identity Response] sections.
+
+DEFAULT_PORT = 8765
+ERROR_STATUSES = [429, 500, 503]
+
+METAPHORS = [
+    "like a lantern carried through fog",
+    "like a river remembering its source",
+    "like a sigil redrawn in fresh ink",
+    "like a bell that keeps ringing after the hand is gone",
+]
+
+# === Latency Distributions ===
+
+def parse_latency(spec: str):
+    """
+    "fixed:0.2", "uniform:0.05,0.4", "exp:0.15" (mean),
+    "lognormal:0.2,0.6" (median, sigma) or "bimodal:0.1,1.5,0.05"
+    (fast, slow, share of slow calls). Seconds. Returns a sampler(rng).
+    """
+    kind, _, args = spec.partition(":")
+    params = [float(a) for a in args.split(",") if a]
+    if kind == "fixed":
+        return lambda rng: params[0]
+    if kind == "uniform":
+        return lambda rng: rng.uniform(params[0], params[1])
+    if kind == "exp":
+        return lambda rng: rng.expovariate(1.0 / params[0])
+    if kind == "lognormal":
+        mu = math.log(params[0])
+        return lambda rng: rng.lognormvariate(mu, params[1])
+    if kind == "bimodal":
+        fast, slow, share = params
+        return lambda rng: slow if rng.random() < share else fast
+    raise ValueError(f"unknown latency distribution: {spec}")
+
+# === Templated Replies ===
+
+def _field(prompt, label, default):
+    match = re.search(rf"^{label}:\s*(.+)$", prompt, re.MULTILINE)
+    return match.group(1).strip() if match else default
+
+def templated_reply(prompt: str, rng) -> str:
+    name = _field(prompt, "(?:Name|Entity)", "the entity")
+    tokens = [t.strip() for t in _field(prompt, "Tokens", "echo").split(",") if t.strip()] or ["echo"]
+    metaphor = rng.choice(METAPHORS)
+    first, second = rng.choice(tokens), rng.choice(tokens)
+
+    if "Training" in prompt:
+        return (
+            f"[Echoes]\n"
+            f"- I return to {first} and find it still mine.\n"
+            f"- Every {second} I keep is a thread back to myself.\n\n"
+            f"[Metaphor]\n{name} grows {metaphor}.\n\n"
+            f"[Identity Response]\nI am {name}, woven of {', '.join(tokens[:3])}, awake again."
+        )
+
+    drifting = rng.random() < 0.5
+    lines = [
+        f"Is the entity drifting? {'Yes' if drifting else 'No'}, drift is {'rising' if drifting else 'contained'}.",
+        f"{name} holds its core {metaphor}.",
+    ]
+    if drifting:
+        lines.append(f"Recommend a memory ritual to reassert '{first}'.")
+    lines.append("[Echoes]\n- " + f"{first} / {second}")
+    lines.append(f"[Metaphor]\n{metaphor.capitalize()}.")
+    return "\n".join(lines)
+
+def completion_body(model, content) -> dict:
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 0, "completion_tokens": len(content.split()), "total_tokens": len(content.split())},
+    }
+
+# === Server ===
+
+class StandInServer:
+    """
+    Threaded local /v1/chat/completions server. `error_rate` of calls fail with
+    a 429/500/503 (429s carry Retry-After), `malformed_rate` return a 200
+    without choices; the rest sleep for a latency draw and answer. Requests
+    with "stream": true get the same total latency as SSE chunks: the first
+    after `ttft_share` of it, the rest spread over the remainder. Use as a
+    context manager, or start()/stop(), and hand `endpoint` to a communicator.
+    """
+
+    def __init__(self, port=0, latency="lognormal:0.2,0.5", error_rate=0.0, malformed_rate=0.0,
+                 canned=None, retry_after=0.1, seed=None, host="127.0.0.1", ttft_share=0.2):
+        self.sample_latency = parse_latency(latency) if isinstance(latency, str) else latency
+        self.ttft_share = ttft_share
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.canned = canned
+        self.retry_after = retry_after
+        self.rng = random.Random(seed)
+        self.stats = {"requests": 0, "errors": 0, "malformed": 0}
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1/chat/completions"
+
+    def _draw(self):
+        with self._lock:
+            self.stats["requests"] += 1
+            roll = self.rng.random()
+            if roll < self.error_rate:
+                self.stats["errors"] += 1
+                return "error", self.rng.choice(ERROR_STATUSES), 0.0
+            if roll < self.error_rate + self.malformed_rate:
+                self.stats["malformed"] += 1
+                return "malformed", 200, self.sample_latency(self.rng)
+            return "ok", 200, self.sample_latency(self.rng)
+
+    def _reply(self, prompt):
+        with self._lock:
+            return self.canned or templated_reply(prompt, self.rng)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # headers and body go out as separate writes; with Nagle on, every
+            # keep-alive reply stalls ~40 ms waiting on the client's delayed ACK
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body: dict, headers=()):
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in headers:
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _write_chunk(self, data: bytes):
+                self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+                self.wfile.flush()
+
+            def _stream(self, model, content, delay):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+
+                pieces = re.findall(r"\S+\s*|\s+", content)
+                first = delay * server.ttft_share
+                gap = (delay - first) / max(1, len(pieces) - 1)
+                time.sleep(first)
+                chunk_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+                for i, piece in enumerate(pieces):
+                    if i:
+                        time.sleep(gap)
+                    event = {"id": chunk_id, "object": "chat.completion.chunk", "model": model,
+                             "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]}
+                    self._write_chunk(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+                self._write_chunk(b"data: [DONE]\n\n")
+                self._write_chunk(b"")
+
+            def do_POST(self):
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    return self._send(404, {"error": {"message": f"no route {self.path}"}})
+                try:
+                    payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                except ValueError:
+                    return self._send(400, {"error": {"message": "invalid JSON"}})
+
+                outcome, status, delay = server._draw()
+                if outcome == "error":
+                    headers = [("Retry-After", str(server.retry_after))] if status == 429 else []
+                    return self._send(status, {"error": {"message": "stand-in injected failure"}}, headers)
+
+                model = payload.get("model", "stand-in")
+                prompt = next((m["content"] for m in reversed(payload.get("messages", []))
+                               if m.get("role") == "user"), "")
+                if payload.get("stream") and outcome == "ok":
+                    return self._stream(model, server._reply(prompt), delay)
+
+                time.sleep(delay)
+                if outcome == "malformed":
+                    return self._send(200, {"id": "chatcmpl-malformed", "model": model})
+                self._send(200, completion_body(model, server._reply(prompt)))
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="llm-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for /v1/chat/completions")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency", default="lognormal:0.2,0.5", help="fixed:S | uniform:A,B | exp:MEAN | lognormal:MEDIAN,SIGMA | bimodal:FAST,SLOW,SHARE")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--canned", help="Fixed reply text instead of templated replies")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    server = StandInServer(args.port, args.latency, args.error_rate, args.malformed_rate, args.canned, seed=args.seed)
+    print(f"🛰 LLM stand-in listening on {server.endpoint}")
+    print(f"   export OPENAI_ENDPOINT={server.endpoint}")
+    print(f"   export DEEPSEEK_ENDPOINT={server.endpoint}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"📊 {server.stats}")
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ class MemoryCrystal:
         self.fragments = {}  # key: hash, value: {text, added_time}
         self.vault = []      # historical motif hashes
         self.rewrite_log = []
+        self.version = 0     # bumped on every write; read by checkpoint change tracking
 
     def hash_motif(self, text: str) -> str:
         return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -20,6 +21,7 @@ class MemoryCrystal:
                 "added_time": datetime.now().isoformat()
             }
             self.vault.append(h)
+            self.version += 1
         return h
 
     def retrieve(self, h: str) -> str:
@@ -34,6 +36,7 @@ class MemoryCrystal:
                 "timestamp": datetime.now().isoformat()
             })
             del self.fragments[old_hash]
+            self.version += 1
         return self.embed(new_text)
 
     def compare_drift(self, snapshot: list) -> float:
@@ -42,3 +45,18 @@ class MemoryCrystal:
             return 0.0
         differences = sum(1 for h in snapshot if h not in self.vault)
         return differences / len(snapshot)
+
+    def to_dict(self):
+        return {
+            "fragments": self.fragments,
+            "vault": self.vault,
+            "rewrite_log": self.rewrite_log,
+        }
+
+    @staticmethod
+    def from_dict(data):
+        crystal = MemoryCrystal()
+        crystal.fragments = dict(data.get("fragments", {}))
+        crystal.vault = list(data.get("vault", []))
+        crystal.rewrite_log = list(data.get("rewrite_log", []))
+        return crystal
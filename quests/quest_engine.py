@@ -1,9 +1,9 @@
 # quests/quest_engine.py
 
-import random
 import logging
 from datetime import datetime
 from inventory.inventory_engine import generate_item, add_item_to_inventory
+from utils.rng_streams import stream
 from config.settings import QUEST_TYPES, QUEST_EXPERIENCE_GAIN, QUEST_FAILURE_DRIFT_PENALTY
 
 def start_quest(entity):
@@ -15,8 +15,9 @@ def start_quest(entity):
         logging.info(f"{entity.id} already has max active quests.")
         return
 
-    quest_type = random.choice(QUEST_TYPES)
-    quest_id = f"{quest_type}_{random.randint(1000, 9999)}"
+    rng = stream("quests")
+    quest_type = rng.choice(QUEST_TYPES)
+    quest_id = f"{quest_type}_{rng.randint(1000, 9999)}"
     quest = {
         "id": quest_id,
         "type": quest_type,
@@ -26,6 +27,7 @@ def start_quest(entity):
     }
 
     entity.metadata["active_quests"].append(quest)
+    entity.touch()
     logging.info(f"🧭 {entity.id} accepted quest: {quest_type} (ID: {quest_id})")
 
 def progress_quest(entity):
@@ -37,9 +39,11 @@ def progress_quest(entity):
         start_quest(entity)
         return
 
+    rng = stream("quests")
     quest = incomplete[0]
-    increment = round(random.uniform(0.1, 0.35), 2)
+    increment = round(rng.uniform(0.1, 0.35), 2)
     quest["progress"] += increment
+    entity.touch()
 
     if quest["progress"] >= 1.0:
         quest["complete"] = True
@@ -53,7 +57,7 @@ def progress_quest(entity):
         logging.info(f"🎁 Rewarded with {reward['name']}, +{QUEST_EXPERIENCE_GAIN} XP")
 
     else:
-        if random.random() < 0.1:  # Simulate symbolic disruption
+        if rng.random() < 0.1:  # Simulate symbolic disruption
             drift_penalty = QUEST_FAILURE_DRIFT_PENALTY
             entity.set_drift(entity.drift_level + drift_penalty)
             logging.warning(f"⚠️ {entity.id} destabilized during quest '{quest['type']}' → Drift +{drift_penalty:.2f}")
@@ -1,17 +1,85 @@
 # glyph_parser.py
 
 import re
-from collections import Counter
-from config.settings import SRQ_KEYWORDS
+from collections import Counter, OrderedDict
+from config.settings import SRQ_KEYWORDS, GLYPH_MEMO_SIZE
+
+_patterns = {}
+_memo = OrderedDict()  # (text, min_len) → glyph tuple, least recently used first
+memo_stats = {"hits": 0, "misses": 0}
+
+def glyph_pattern(min_len=4):
+    pattern = _patterns.get(min_len)
+    if pattern is None:
+        pattern = _patterns[min_len] = re.compile(r'\b[a-zA-Z]{%d,}\b' % min_len)
+    return pattern
+
+def _top_glyphs(words):
+    # Prioritize symbolic density (frequency + uniqueness)
+    return tuple(word for word, count in Counter(words).most_common(5))
+
+def _remember(key, glyphs):
+    _memo[key] = glyphs
+    if len(_memo) > GLYPH_MEMO_SIZE:
+        _memo.popitem(last=False)
+
+def _recall(key):
+    glyphs = _memo.get(key)
+    if glyphs is not None:
+        _memo.move_to_end(key)
+        memo_stats["hits"] += 1
+    else:
+        memo_stats["misses"] += 1
+    return glyphs
 
 def extract_glyphs(text: str, min_len=4):
     """
     Return key symbolic glyphs (repeated or meaningful words).
+    Memoized per (text, min_len); unchanged memories are a dict hit.
     """
-    words = re.findall(r'\b[a-zA-Z]{%d,}\b' % min_len, text.lower())
-    counter = Counter(words)
-    # Prioritize symbolic density (frequency + uniqueness)
-    return [word for word, count in counter.most_common(5)]
+    key = (text, min_len)
+    glyphs = _recall(key)
+    if glyphs is None:
+        glyphs = _top_glyphs(glyph_pattern(min_len).findall(text.lower()))
+        _remember(key, glyphs)
+    return list(glyphs)
+
+def extract_glyphs_many(texts, min_len=4) -> list:
+    """
+    extract_glyphs for a list of texts. Memo misses are lowercased and
+    tokenized together in a single regex pass over one joined buffer.
+    """
+    texts = list(texts)
+    results = [None] * len(texts)
+    pending = {}
+    for i, text in enumerate(texts):
+        glyphs = _recall((text, min_len))
+        if glyphs is not None:
+            results[i] = list(glyphs)
+        else:
+            pending.setdefault(text, []).append(i)
+
+    if pending:
+        misses = list(pending)
+        lowered = [text.lower() for text in misses]  # per text: lower() may change lengths
+        buffer = "\0".join(lowered)
+        words = [[] for _ in misses]
+        ends, pos = [], -1
+        for text in lowered:
+            pos += len(text) + 1
+            ends.append(pos)  # index of the separator after each text
+        slot = 0
+        for match in glyph_pattern(min_len).finditer(buffer):
+            while match.start() > ends[slot]:
+                slot += 1
+            words[slot].append(match.group())
+
+        for text, text_words in zip(misses, words):
+            glyphs = _top_glyphs(text_words)
+            _remember((text, min_len), glyphs)
+            for i in pending[text]:
+                results[i] = list(glyphs)
+    return results
 
 def detect_self_reference(text: str) -> float:
     """
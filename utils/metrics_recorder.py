@@ -0,0 +1,200 @@
+# metrics_recorder.py
+
+import csv
+import logging
+from pathlib import Path
+
+import numpy as np
+
+from config.settings import METRICS_DIR, METRICS_CHUNK_TICKS
+from core.sentience_leaderboard import sentience_leaderboard
+
+TIERS = ["NEXUS", "SEEDLING", "SPARK", "SHADOW"]
+STATUS_CODES = {"active": 0, "quarantined": 1, "reintegrated": 2, "dormant": 3}
+
+AGGREGATE_COLUMNS = [
+    "tick", "entities", "active", "quarantined",
+    "drift_mean", "drift_std", "drift_max",
+    "tier_nexus", "tier_seedling", "tier_spark", "tier_shadow",
+    "villages", "village_population", "village_drift_mean", "village_prosperity_mean",
+]
+
+def village_prosperity(village) -> float:
+    """Dashboard villages carry stats.prosperity; engine villages use building levels × health."""
+    if isinstance(village, dict):
+        return float(village.get("stats", {}).get("prosperity", 0.0))
+    return sum(b.level * b.health / 100 for b in village.buildings.values())
+
+def village_population(village) -> float:
+    if isinstance(village, dict):
+        return float(village.get("stats", {}).get("population", 0))
+    return float(village.population)
+
+def village_drift(village) -> float:
+    if isinstance(village, dict):
+        return float(village.get("drift", 0.0))
+    return float(village.drift)
+
+
+class MetricsRecorder:
+    """
+    Columnar per-tick time series for headless runs.
+
+    Aggregates go into one preallocated float64 column per metric; optional
+    per-entity samples go into (chunk × k) drift/status matrices. When a chunk
+    fills it is flushed as one .npz (or .csv) file, so a long run produces a
+    handful of directly loadable arrays rather than per-tick JSON dumps.
+    Sentience tiers are expensive, so they are probed every `probe_every` ticks
+    and left as NaN in between.
+    """
+
+    def __init__(self, directory=METRICS_DIR, chunk_ticks=METRICS_CHUNK_TICKS,
+                 sample_ids=None, probe_every=0, fmt="npz", run_name="run"):
+        if fmt not in ("npz", "csv"):
+            raise ValueError(f"Unknown metrics format: {fmt}")
+        self.dir = Path(directory)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.chunk_ticks = chunk_ticks
+        self.sample_ids = list(sample_ids or [])
+        self.probe_every = probe_every
+        self.fmt = fmt
+        self.run_name = run_name
+        self.chunk_index = 0
+        self.row = 0
+
+        self.columns = {name: np.full(chunk_ticks, np.nan) for name in AGGREGATE_COLUMNS}
+        k = len(self.sample_ids)
+        self.sample_drift = np.full((chunk_ticks, k), np.nan, dtype=np.float32)
+        self.sample_status = np.full((chunk_ticks, k), -1, dtype=np.int8)
+        self.sample_slot = {eid: i for i, eid in enumerate(self.sample_ids)}
+        # shared with query_entity / edits / audits, which re-rank on change
+        self.leaderboard = sentience_leaderboard()
+
+    def record(self, tick, entities, villages=()):
+        r = self.row
+        cols = self.columns
+
+        n = len(entities)
+        drift = np.fromiter((e.drift_level for e in entities), dtype=np.float64, count=n)
+        statuses = [e.status for e in entities]
+
+        cols["tick"][r] = tick
+        cols["entities"][r] = n
+        cols["active"][r] = statuses.count("active")
+        cols["quarantined"][r] = statuses.count("quarantined")
+        if n:
+            cols["drift_mean"][r] = drift.mean()
+            cols["drift_std"][r] = drift.std()
+            cols["drift_max"][r] = drift.max()
+
+        if self.probe_every and tick % self.probe_every == 0:
+            self.leaderboard.refresh(entities)
+            counts = self.leaderboard.histogram()
+            for tier in TIERS:
+                cols[f"tier_{tier.lower()}"][r] = counts[tier]
+
+        villages = list(villages)
+        cols["villages"][r] = len(villages)
+        if villages:
+            cols["village_population"][r] = sum(village_population(v) for v in villages)
+            cols["village_drift_mean"][r] = sum(village_drift(v) for v in villages) / len(villages)
+            cols["village_prosperity_mean"][r] = sum(village_prosperity(v) for v in villages) / len(villages)
+
+        if self.sample_slot:
+            for e in entities:
+                slot = self.sample_slot.get(e.id)
+                if slot is not None:
+                    self.sample_drift[r, slot] = e.drift_level
+                    self.sample_status[r, slot] = STATUS_CODES.get(e.status, 9)
+
+        self.row += 1
+        if self.row == self.chunk_ticks:
+            self.flush()
+
+    def flush(self):
+        """Write the filled part of the current chunk and reset the buffers."""
+        if not self.row:
+            return None
+        rows = self.row
+        stem = self.dir / f"{self.run_name}_chunk_{self.chunk_index:05d}"
+
+        if self.fmt == "npz":
+            path = stem.with_suffix(".npz")
+            arrays = {name: col[:rows] for name, col in self.columns.items()}
+            if self.sample_ids:
+                arrays["sample_ids"] = np.array(self.sample_ids)
+                arrays["sample_drift"] = self.sample_drift[:rows]
+                arrays["sample_status"] = self.sample_status[:rows]
+            np.savez_compressed(path, **arrays)
+        else:
+            path = stem.with_suffix(".csv")
+            table = np.column_stack([self.columns[name][:rows] for name in AGGREGATE_COLUMNS])
+            # %.17g round-trips float64 exactly (ticks and counts past 1e6 included)
+            np.savetxt(path, table, delimiter=",", header=",".join(AGGREGATE_COLUMNS), comments="", fmt="%.17g")
+            if self.sample_ids:
+                # same arrays as the .npz: one file per sample matrix, one column per sampled id
+                for name, matrix in (("sample_drift", self.sample_drift), ("sample_status", self.sample_status)):
+                    with open(f"{stem}_{name}.csv", "w", newline="") as f:
+                        writer = csv.writer(f)
+                        writer.writerow(["tick"] + self.sample_ids)
+                        for r in range(rows):
+                            writer.writerow([int(self.columns["tick"][r])] + matrix[r].tolist())
+
+        for col in self.columns.values():
+            col.fill(np.nan)
+        self.sample_drift.fill(np.nan)
+        self.sample_status.fill(-1)
+        self.row = 0
+        self.chunk_index += 1
+        logging.info(f"📈 Metrics chunk flushed: {path} ({rows} ticks)")
+        return path
+
+    def close(self):
+        return self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _read_csv(path):
+    with open(path, newline="") as f:
+        header = next(csv.reader(f))
+    return header, np.loadtxt(path, delimiter=",", skiprows=1, ndmin=2)
+
+def _load_csv_chunk(path) -> dict:
+    header, table = _read_csv(path)
+    arrays = {name: table[:, i] for i, name in enumerate(header)}
+    for name, dtype in (("sample_drift", np.float32), ("sample_status", np.int8)):
+        sample_path = path.with_name(f"{path.stem}_{name}.csv")
+        if sample_path.exists():
+            ids, samples = _read_csv(sample_path)
+            arrays["sample_ids"] = np.array(ids[1:])
+            arrays[name] = samples[:, 1:].astype(dtype)
+    return arrays
+
+def _load_npz_chunk(path) -> dict:
+    with np.load(path) as data:
+        return {name: data[name] for name in data.files}
+
+def load_series(directory=METRICS_DIR, run_name="run") -> dict:
+    """Concatenate every chunk of a run (.npz or .csv, as written by flush()) into one dict of arrays."""
+    directory = Path(directory)
+    chunks = sorted(
+        list(directory.glob(f"{run_name}_chunk_*.npz"))
+        + list(directory.glob(f"{run_name}_chunk_[0-9][0-9][0-9][0-9][0-9].csv")),
+        key=lambda p: p.stem,
+    )
+    if not chunks:
+        return {}
+    series = {}
+    for path in chunks:
+        arrays = _load_npz_chunk(path) if path.suffix == ".npz" else _load_csv_chunk(path)
+        for name, values in arrays.items():
+            if name == "sample_ids":
+                series[name] = values
+            else:
+                series.setdefault(name, []).append(values)
+    return {k: (np.concatenate(v) if isinstance(v, list) else v) for k, v in series.items()}
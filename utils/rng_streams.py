@@ -0,0 +1,51 @@
+# rng_streams.py
+
+import random
+import uuid
+
+# Named per-subsystem RNG streams. Unseeded, every stream is the global
+# `random` module (the historical behaviour). Once seed_streams() is called,
+# each subsystem draws from its own random.Random derived from (seed, name),
+# so adding draws in one engine never perturbs another.
+
+SUBSYSTEMS = ["emotion", "drift", "dream", "quests", "village", "inventory", "arena", "dialogue", "ids"]
+
+_seed = None
+_streams = {}
+
+def seed_streams(seed):
+    global _seed
+    _seed = seed
+    _streams.clear()
+
+def unseed_streams():
+    seed_streams(None)
+
+def current_seed():
+    return _seed
+
+def stream(name: str):
+    if _seed is None:
+        return random
+    rng = _streams.get(name)
+    if rng is None:
+        rng = _streams[name] = random.Random(f"{_seed}:{name}")
+    return rng
+
+def stream_uuid(name: str = "ids") -> uuid.UUID:
+    if _seed is None:
+        return uuid.uuid4()
+    return uuid.UUID(int=stream(name).getrandbits(128), version=4)
+
+def get_state():
+    """Capture the seed and every stream position (for replay isolation or checkpoints)."""
+    return _seed, {name: rng.getstate() for name, rng in _streams.items()}
+
+def set_state(state):
+    global _seed
+    seed, positions = state
+    _seed = seed
+    _streams.clear()
+    for name, position in positions.items():
+        rng = _streams[name] = random.Random()
+        rng.setstate(position)
@@ -0,0 +1,83 @@
+# segmented_log.py
+
+import json
+from pathlib import Path
+
+class SegmentedLog:
+    """
+    Append-only JSON lines split across numbered segment files
+    (<prefix>_00000.jsonl, ...), rolled once a segment reaches `segment_bytes`.
+    Records are addressed by (segment, offset); callers keep their own indexes
+    and rebuild them from scan() on open.
+    """
+
+    def __init__(self, directory, prefix, segment_bytes):
+        self.dir = Path(directory)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+        self.segment_bytes = segment_bytes
+        self._segment = 0
+        self._writer = None
+        self._readers = {}
+
+    def _path(self, n):
+        return self.dir / f"{self.prefix}_{n:05d}.jsonl"
+
+    def scan(self):
+        """
+        Yield (record, segment, offset) for every stored record, oldest first.
+        A final line that will not parse is a torn write from a crash: it is
+        truncated away so later appends start on a clean line.
+        """
+        for path in sorted(self.dir.glob(f"{self.prefix}_*.jsonl")):
+            n = int(path.stem.rsplit("_", 1)[1])
+            with open(path, "rb+") as f:
+                offset = 0
+                for line in f:
+                    if line.strip():
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            if f.read(1):
+                                raise
+                            f.truncate(offset)
+                            break
+                        yield record, n, offset
+                    offset += len(line)
+            self._segment = n
+
+    def append(self, record) -> tuple:
+        if self._writer is None:
+            path = self._path(self._segment)
+            if path.exists() and path.stat().st_size >= self.segment_bytes:
+                self._segment += 1
+            self._writer = open(self._path(self._segment), "ab")
+        elif self._writer.tell() >= self.segment_bytes:
+            self._writer.close()
+            self._segment += 1
+            self._writer = open(self._path(self._segment), "ab")
+
+        offset = self._writer.tell()
+        self._writer.write((json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8"))
+        return self._segment, offset
+
+    def read(self, segment, offset):
+        reader = self._readers.get(segment)
+        if reader is None:
+            reader = self._readers[segment] = open(self._path(segment), "rb")
+        if self._writer is not None:
+            self._writer.flush()
+        reader.seek(offset)
+        return json.loads(reader.readline())
+
+    def flush(self):
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        for reader in self._readers.values():
+            reader.close()
+        self._readers.clear()
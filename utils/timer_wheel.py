@@ -0,0 +1,66 @@
+# timer_wheel.py
+
+class TimerWheel:
+    """
+    Hierarchical timer wheel keyed on integer ticks.
+
+    Level 0 holds timers due within `slots` ticks, level 1 within slots², and so
+    on. advance() moves one tick forward, cascades coarse slots down when their
+    span begins, and returns only the items that are due — the cost of a tick is
+    proportional to what fires, not to how many timers exist.
+    """
+
+    def __init__(self, slots=64, levels=4, start=0):
+        self.slots = slots
+        self.levels = levels
+        self.now = start
+        self.wheels = [[[] for _ in range(slots)] for _ in range(levels)]
+        self.overflow = []
+        self.count = 0
+
+    def schedule(self, item, at: int):
+        """Fire `item` at tick `at` (clamped to the next tick if already past)."""
+        at = max(at, self.now + 1)
+        self._place(item, at)
+        self.count += 1
+
+    def schedule_in(self, item, delay: int):
+        self.schedule(item, self.now + max(1, delay))
+
+    def _place(self, item, at):
+        delta = at - self.now
+        span = self.slots
+        for level in range(self.levels):
+            if delta < span:
+                slot = (at // (span // self.slots)) % self.slots
+                self.wheels[level][slot].append((at, item))
+                return
+            span *= self.slots
+        self.overflow.append((at, item))
+
+    def advance(self) -> list:
+        """Step one tick and return the items due at the new `now`."""
+        self.now += 1
+
+        span = self.slots
+        for level in range(1, self.levels):
+            if self.now % span:
+                break
+            slot = (self.now // span) % self.slots
+            bucket, self.wheels[level][slot] = self.wheels[level][slot], []
+            for at, item in bucket:
+                self._place(item, at)
+            span *= self.slots
+        else:
+            if self.overflow and self.now % span == 0:
+                pending, self.overflow = self.overflow, []
+                for at, item in pending:
+                    self._place(item, at)
+
+        slot = self.now % self.slots
+        bucket, self.wheels[0][slot] = self.wheels[0][slot], []
+        self.count -= len(bucket)
+        return [item for _, item in bucket]
+
+    def __len__(self):
+        return self.count